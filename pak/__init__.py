@@ -1,10 +1,4 @@
-import importlib.metadata
-
-# Dynamically get version.
-__version__ = importlib.metadata.version(__name__)
-
-# Remove import from our exported variables
-del importlib
+from ._version import __version__
 
 from .bit_field import *
 from .dyn_value import *
@@ -0,0 +1,3 @@
+"""The version of Pak."""
+
+__version__ = "1.1.0"
@@ -1,5 +1,7 @@
 """Contains :class:`.BitField`."""
 
+import inspect
+
 from . import util
 
 from .types.type import Type
@@ -12,12 +14,20 @@ class _BitFieldType(Type):
     bitfield_cls = None
     underlying   = None
 
+    # The methods used for marshaling, looked up once when
+    # the type is made so that they're not looked up each time.
+    _pack_int                = None
+    _unpack_int              = None
+    _underlying_pack         = None
+    _underlying_unpack       = None
+    _underlying_unpack_async = None
+
     @classmethod
     def _size(cls, value, *, ctx):
         if value is cls.STATIC_SIZE:
             return cls.underlying.size(ctx=ctx)
 
-        return cls.underlying.size(value.pack_to_int(), ctx=ctx)
+        return cls.underlying.size(cls._pack_int(value), ctx=ctx)
 
     @classmethod
     def _alignment(cls, *, ctx):
@@ -29,27 +39,76 @@ class _BitFieldType(Type):
 
     @classmethod
     def _unpack(cls, buf, *, ctx):
-        return cls.bitfield_cls.unpack_from_int(cls.underlying.unpack(buf, ctx=ctx))
+        return cls._unpack_int(cls._underlying_unpack(buf, ctx=ctx))
 
     @classmethod
     async def _unpack_async(cls, reader, *, ctx):
-        return cls.bitfield_cls.unpack_from_int(await cls.underlying.unpack_async(reader, ctx=ctx))
+        return cls._unpack_int(await cls._underlying_unpack_async(reader, ctx=ctx))
 
     @classmethod
     def _pack(cls, value, *, ctx):
-        return cls.underlying.pack(value.pack_to_int(), ctx=ctx)
+        return cls._underlying_pack(cls._pack_int(value), ctx=ctx)
 
     @classmethod
     def _call(cls, name, bitfield_cls, underlying):
+        namespace = {}
+
+        # If the underlying type always has the same size,
+        # then so do we, so we can just use that size directly
+        # instead of asking the underlying type each time.
+        if isinstance(underlying._size, int):
+            namespace["_size"] = underlying._size
+
         return cls.make_type(
             name,
 
             bitfield_cls = bitfield_cls,
             underlying   = underlying,
+
+            _pack_int                = staticmethod(bitfield_cls.pack_to_int),
+            _unpack_int              = staticmethod(bitfield_cls.unpack_from_int),
+            _underlying_pack         = staticmethod(underlying.pack),
+            _underlying_unpack       = staticmethod(underlying.unpack),
+            _underlying_unpack_async = staticmethod(underlying.unpack_async),
+
+            **namespace,
         )
 
 
-class BitField:
+class _BitFieldMeta(type):
+    # A metaclass so that BitFields may opt into having
+    # their fields be slot attributes, since slot attributes
+    # can't be added after class initialization.
+
+    def __new__(cls, name, bases, namespace, *, slots=False, **kwargs):
+        # 'BitField' itself needs its empty '__slots__'.
+        if bases and "__slots__" in namespace:
+            raise TypeError(f"'{namespace['__qualname__']}' may not define '__slots__'; pass 'slots=True' instead")
+
+        if slots:
+            namespace = dict(namespace)
+            namespace["__slots__"] = tuple(util.annotations(cls._annotations_holder(name, namespace)).keys())
+
+        return super().__new__(cls, name, bases, namespace, **kwargs)
+
+    def __init__(cls, name, bases, namespace, *, slots=False, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+
+    @staticmethod
+    def _annotations_holder(name, namespace):
+        # The annotations might not be directly in the namespace,
+        # such as when they're lazily evaluated, and so we make a
+        # bare class with just what holds the annotations so that
+        # we get them the same way as the rest of 'BitField' does.
+
+        return type(name, (), {
+            attr: namespace[attr]
+
+            for attr in ("__annotations__", "__annotate__", "__annotate_func__")
+            if attr in namespace
+        })
+
+class BitField(metaclass=_BitFieldMeta):
     r"""A collection of data packed into specific bits of an underlying integer.
 
     A definition of a :class:`BitField` looks like this::
@@ -72,6 +131,14 @@ class BitField:
     If a field is specified to have a bit width of ``0``, then a
     :exc:`TypeError` is raised.
 
+    The fields of a :class:`BitField` may be made slot attributes,
+    reducing the memory used by each instance, by passing ``slots=True``
+    when defining the :class:`BitField`, like so::
+
+        class MySlotsBitField(pak.BitField, slots=True):
+            boolean_field: 1
+            integer_field: 2
+
     Parameters
     ----------
     **fields
@@ -84,10 +151,17 @@ class BitField:
         If there are any superfluous keyword arguments.
     """
 
+    # Allow subclasses to have no instance dictionary
+    # when their fields are made slot attributes.
+    __slots__ = ()
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
-        for base in cls.mro()[1:]:
+        # Only the direct bases need to be checked, since
+        # any indirect subclass of a BitField subclass would
+        # have already been rejected when it was defined.
+        for base in cls.__bases__:
             if base is BitField:
                 continue
 
@@ -99,6 +173,141 @@ class BitField:
         if 0 in cls._fields.values():
             raise TypeError("A BitField may not have a field of width '0'")
 
+        # Precompute where each field lies so that packing
+        # and unpacking don't need to recalculate it each time.
+        field_layout = []
+
+        start_bit = 0
+        for field, bit_width in cls._fields.items():
+            field_layout.append((field, start_bit, util.bit(bit_width) - 1, bit_width == 1))
+
+            start_bit += bit_width
+
+        cls._field_layout = tuple(field_layout)
+
+        cls._defaults = {
+            field: False if bit_width == 1 else 0
+
+            for field, bit_width in cls._fields.items()
+        }
+
+        # The fields may only be written straight into the
+        # instance dictionary when doing so is equivalent to
+        # setting them normally, i.e. when there's no custom
+        # '__setattr__' and no field is a data descriptor
+        # (which includes slot attributes and properties).
+        cls._update_dict_directly = (
+            cls.__setattr__ is object.__setattr__ and
+
+            not any(
+                cls._is_data_descriptor(inspect.getattr_static(cls, field, None))
+
+                for field in cls._fields.keys()
+            )
+        )
+
+        # Getting the values of all the fields as a tuple lets
+        # us compare and format them all at once instead of
+        # one by one.
+        cls._field_values = util.generate_function(
+            "_field_values", "self",
+
+            [f"return ({''.join(f'self.{field}, ' for field in cls._fields.keys())})"],
+
+            qualname = f"{cls.__qualname__}._field_values",
+            module   = cls.__module__,
+        )
+
+        # The representation is filled in with the field values by '%'-formatting.
+        cls._repr_template = (
+            f"{cls.__qualname__}("
+
+            +
+
+            ", ".join(f"{field}=%r" for field in cls._fields.keys())
+
+            +
+
+            ")"
+        )
+
+        cls._generate_marshal_methods()
+
+    @staticmethod
+    def _is_data_descriptor(obj):
+        descriptor_type = type(obj)
+
+        return hasattr(descriptor_type, "__set__") or hasattr(descriptor_type, "__delete__")
+
+    @classmethod
+    def _generate_marshal_methods(cls):
+        # Since the fields of a BitField are fixed, we generate
+        # versions of 'unpack_from_int' and 'pack_to_int' which
+        # are specialized to them, avoiding looping over each
+        # field at every call.
+        #
+        # We leave alone any methods that the subclass defines itself.
+
+        unpack_body = ["self = object.__new__(cls)"]
+
+        pack_body       = []
+        overflow_checks = []
+        packed_fields   = []
+
+        for i, (field, start_bit, bit_range, is_bool) in enumerate(cls._field_layout):
+            if is_bool:
+                unpack_body.append(f"self.{field} = value & {util.bit(start_bit)} != 0")
+
+                packed_fields.append(f"({util.bit(start_bit)} if self.{field} else 0)")
+
+            else:
+                unpack_body.append(f"self.{field} = (value >> {start_bit}) & {bit_range}")
+
+                pack_body.append(f"field_{i} = self.{field}")
+                overflow_checks.append(f"(field_{i} & ~{bit_range})")
+                packed_fields.append(f"(field_{i} << {start_bit})")
+
+        unpack_body.append("return self")
+
+        if len(overflow_checks) > 0:
+            # Check all fields for being too wide at once, deferring
+            # to the generic implementation to report the error.
+            pack_body += [
+                f"if {' | '.join(overflow_checks)}:",
+                "    return BitField.pack_to_int(self)",
+            ]
+
+        pack_body.append(f"return {' | '.join(packed_fields) or '0'}")
+
+        if "unpack_from_int" not in vars(cls):
+            unpack_from_int = util.generate_function(
+                "unpack_from_int", "cls, value",
+
+                unpack_body,
+
+                qualname = f"{cls.__qualname__}.unpack_from_int",
+                module   = cls.__module__,
+            )
+
+            unpack_from_int.__doc__ = BitField.unpack_from_int.__doc__
+
+            cls.unpack_from_int = classmethod(unpack_from_int)
+
+        if "pack_to_int" not in vars(cls):
+            pack_to_int = util.generate_function(
+                "pack_to_int", "self",
+
+                pack_body,
+
+                namespace = dict(BitField=BitField),
+                qualname  = f"{cls.__qualname__}.pack_to_int",
+                module    = cls.__module__,
+            )
+
+            pack_to_int.__doc__ = BitField.pack_to_int.__doc__
+
+            cls.pack_to_int = pack_to_int
+
     @classmethod
     @Type.prepare_types
     def Type(cls, underlying: Type):
@@ -119,17 +328,26 @@ class BitField:
         return _BitFieldType(f"{cls.__qualname__}.Type({underlying.__qualname__})", cls, underlying)
 
     def __init__(self, **fields):
-        for attr, bit_width in self._fields.items():
-            if attr in fields:
-                setattr(self, attr, fields.pop(attr))
+        defaults = self._defaults
 
-                continue
+        if not fields.keys() <= defaults.keys():
+            unexpected_fields = {attr: value for attr, value in fields.items() if attr not in defaults}
 
-            else:
-                setattr(self, attr, False if bit_width == 1 else 0)
+            raise TypeError(f"Unexpected keyword arguments for '{type(self).__qualname__}': {unexpected_fields}")
 
-        if len(fields) != 0:
-            raise TypeError(f"Unexpected keyword arguments for '{type(self).__qualname__}': {fields}")
+        if not self._update_dict_directly:
+            for field, value in (defaults | fields).items():
+                setattr(self, field, value)
+
+            return
+
+        # Set the default values and then overlay the
+        # passed values in bulk, since the fields of a
+        # BitField are just plain instance attributes.
+        instance_dict = vars(self)
+
+        instance_dict.update(defaults)
+        instance_dict.update(fields)
 
     @classmethod
     def unpack_from_int(cls, value):
@@ -149,17 +367,12 @@ class BitField:
 
         self = object.__new__(cls)
 
-        start_bit = 0
-        for field, bit_width in cls._fields.items():
-            if bit_width == 1:
-                setattr(self, field, value & util.bit(start_bit) != 0)
+        for field, start_bit, bit_range, is_bool in cls._field_layout:
+            if is_bool:
+                setattr(self, field, (value >> start_bit) & 1 != 0)
             else:
-                bit_range = util.bit(bit_width) - 1
-
                 setattr(self, field, (value >> start_bit) & bit_range)
 
-            start_bit += bit_width
-
         return self
 
     def pack_to_int(self):
@@ -178,53 +391,28 @@ class BitField:
 
         result = 0
 
-        start_bit = 0
-        for field, bit_width in self._fields.items():
+        for field, start_bit, bit_range, is_bool in self._field_layout:
             field_value = getattr(self, field)
 
-            if bit_width == 1:
+            if is_bool:
                 if field_value:
-                    result |= util.bit(start_bit)
-                else:
-                    result &= ~util.bit(start_bit)
+                    result |= 1 << start_bit
 
             else:
-                bit_range = util.bit(bit_width) - 1
-
                 if field_value != (field_value & bit_range):
+                    bit_width = bit_range.bit_length()
+
                     raise ValueError(f"Value '{field_value}' is too wide for width '{bit_width}' of field '{field}'")
 
-                # Clear the old bits and shift
-                # the new ones into place.
-                result &= ~(bit_range << start_bit)
                 result |= (field_value << start_bit)
 
-            start_bit += bit_width
-
         return result
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
             return NotImplemented
 
-        return all(
-            getattr(self, field) == getattr(other, field)
-
-            for field in self._fields.keys()
-        )
+        return self._field_values() == other._field_values()
 
     def __repr__(self):
-        return (
-            f"{type(self).__qualname__}("
-
-            +
-
-            ", ".join(
-                f'{attr}={repr(getattr(self, attr))}'
-                for attr in self._fields.keys()
-            )
-
-            +
-
-            ")"
-        )
+        return self._repr_template % self._field_values()
@@ -1,7 +1,7 @@
 """Code for transforming certain values into dynamic values."""
 
 import abc
-from contextlib import contextmanager
+import weakref
 
 from . import util
 
@@ -9,6 +9,25 @@ __all__ = [
     "DynamicValue",
 ]
 
+def _no_subclass():
+    # Stands in for a weak reference to a
+    # subclass when there is no subclass.
+    return None
+
+class _DynamicValueContext:
+    # A plain context manager instead of one made
+    # with 'contextlib.contextmanager' so that we
+    # avoid creating a generator each time.
+
+    def __init__(self, dynamic_value_cls):
+        self.dynamic_value_cls = dynamic_value_cls
+
+    def __enter__(self):
+        self.dynamic_value_cls.enable()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.dynamic_value_cls.disable()
+
 class DynamicValue(abc.ABC):
     r"""A definition of how to dynamically get one value from another.
 
@@ -86,9 +105,57 @@ class DynamicValue(abc.ABC):
     _type    = None
     _enabled = None
 
+    # The enabled subclasses, keyed by their '_type' attribute.
+    #
+    # Subclasses whose '_type' is a plain class are looked
+    # up by walking the MRO of the initial value's type.
+    #
+    # Other subclasses, such as those whose '_type' is an
+    # abstract base class or a tuple of types, must be
+    # checked with 'isinstance'.
+    #
+    # The subclasses are only weakly referenced so that
+    # a subclass which is otherwise unreferenced, e.g. one
+    # which was defined locally, may still be collected and
+    # thus stop being used.
+    _mro_subclasses      = weakref.WeakValueDictionary()
+    _instance_subclasses = weakref.WeakValueDictionary()
+
+    # The results of walking the MRO of types of initial
+    # values, which is cleared whenever the enabled
+    # subclasses change.
+    #
+    # Most initial values have one of only a few types,
+    # and most of those are not dealt with by any subclass,
+    # so this lets us usually skip walking the MRO.
+    #
+    # The resolved subclasses are stored as weak references
+    # so that they may still be collected, and the cache is
+    # cleared once it grows too large so that it doesn't keep
+    # alive every type ever passed to 'DynamicValue'.
+    _resolved_subclasses     = {}
+    _max_resolved_subclasses = 256
+
     def __new__(cls, initial_value):
-        for subclass in util.subclasses(DynamicValue):
-            if subclass._enabled and isinstance(initial_value, subclass._type):
+        value_type = type(initial_value)
+
+        try:
+            subclass = DynamicValue._resolved_subclasses[value_type]()
+
+        except KeyError:
+            subclass = DynamicValue._resolve_subclass(value_type)
+
+            resolved_subclasses = DynamicValue._resolved_subclasses
+            if len(resolved_subclasses) >= DynamicValue._max_resolved_subclasses:
+                resolved_subclasses.clear()
+
+            resolved_subclasses[value_type] = _no_subclass if subclass is None else weakref.ref(subclass)
+
+        if subclass is not None:
+            return subclass(initial_value)
+
+        for value_type, subclass in DynamicValue._instance_subclasses.items():
+            if isinstance(initial_value, value_type):
                 return subclass(initial_value)
 
         return initial_value
@@ -97,12 +164,16 @@ class DynamicValue(abc.ABC):
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
-        if cls._enabled is None:
+        if cls._enabled is None or cls._enabled:
             # NOTE: Calling 'enable' sets the '_enabled' attribute,
             # which may make this problematic with inheritance.
             # Presently however we do not care about this potential issue.
             cls.enable()
 
+        # Make sure that we don't use a subclass that's
+        # been collected through its dead weak reference.
+        weakref.finalize(cls, DynamicValue._resolved_subclasses.clear)
+
         # Reset '__new__' to a conventional state.
         if cls.__new__ is DynamicValue.__new__:
             cls.__new__ = lambda cls, *args, **kwargs: object.__new__(cls)
@@ -113,14 +184,48 @@ class DynamicValue(abc.ABC):
 
         cls._enabled = True
 
+        cls._subclasses_for_type()[cls._type] = cls
+        DynamicValue._resolved_subclasses.clear()
+
     @classmethod
     def disable(cls):
         """Disables the class to be used in the :class:`DynamicValue` machinery."""
 
         cls._enabled = False
 
+        subclasses = cls._subclasses_for_type()
+        if subclasses.get(cls._type) is not cls:
+            return
+
+        subclasses.pop(cls._type)
+        DynamicValue._resolved_subclasses.clear()
+
+        # Fall back to any other enabled subclass with the same type.
+        for subclass in util.subclasses(DynamicValue):
+            if subclass._enabled and subclass._type == cls._type:
+                subclasses[cls._type] = subclass
+
+                break
+
+    @staticmethod
+    def _resolve_subclass(value_type):
+        mro_subclasses = DynamicValue._mro_subclasses
+
+        for base in value_type.__mro__:
+            subclass = mro_subclasses.get(base)
+            if subclass is not None:
+                return subclass
+
+        return None
+
+    @classmethod
+    def _subclasses_for_type(cls):
+        if type(cls._type) is type:
+            return DynamicValue._mro_subclasses
+
+        return DynamicValue._instance_subclasses
+
     @classmethod
-    @contextmanager
     def context(cls):
         """Temporarily enables then disables the class.
 
@@ -142,12 +247,7 @@ class DynamicValue(abc.ABC):
         '1'
         """
 
-        try:
-            cls.enable()
-
-            yield
-        finally:
-            cls.disable()
+        return _DynamicValueContext(cls)
 
     @abc.abstractmethod
     def get(self, *, ctx=None):
@@ -2,13 +2,24 @@
 
 import abc
 import asyncio
+import contextvars
 
 from .. import util
 
+from .streams import BufferedReader
+
 __all__ = [
     "Connection",
 ]
 
+# The IDs of the 'Connection's which are within a call
+# to 'write_packets' in the current task, for which
+# draining in 'write_data' is deferred.
+#
+# This is a context variable so that other tasks writing to
+# the same 'Connection' in the meantime still drain properly.
+_deferred_drain_ids = contextvars.ContextVar("_deferred_drain_ids", default=frozenset())
+
 class Connection(abc.ABC):
     r"""A connection between two :class:`.Packet` sources.
 
@@ -29,6 +40,12 @@ class Connection(abc.ABC):
         The stream for outgoing data.
     ctx : :class:`.Packet.Context`
         The context for incoming and outgoing :class:`.Packet`\s.
+    buffer_size : :class:`int` or ``None``
+        If not ``None``, then ``reader`` is wrapped in a
+        :class:`io.BufferedReader <.BufferedReader>` which reads
+        ``buffer_size`` bytes at once from ``reader``.
+
+        This may speed up reading many small amounts of data.
 
     Attributes
     ----------
@@ -56,7 +73,12 @@ class Connection(abc.ABC):
     of the of the ``async with`` statement.
     """
 
-    def __init__(self, *, reader=None, writer=None, ctx):
+    __slots__ = ("reader", "writer", "ctx", "_packet_watch_info")
+
+    def __init__(self, *, reader=None, writer=None, ctx, buffer_size=None):
+        if reader is not None and buffer_size is not None:
+            reader = BufferedReader(reader, capacity=buffer_size)
+
         self.reader = reader
         self.writer = writer
 
@@ -140,8 +162,19 @@ class Connection(abc.ABC):
 
             If EOF is reached on the :attr:`reader` attribute and
             ``size`` bytes cannot be read, then ``None`` is returned.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            If ``size`` is negative.
         """
 
+        if size < 0:
+            raise ValueError(f"Cannot read a negative amount of data: {size}")
+
+        if size == 0:
+            return b""
+
         try:
             return await self.reader.readexactly(size)
 
@@ -180,16 +213,17 @@ class Connection(abc.ABC):
         raise NotImplementedError
 
     def _dispatch_to_packet_watches(self, packet):
-        # Make a copy of the items so we may modify
-        # 'self._packet_watch_info' within the same loop.
-        for packet_cls, packet_holder in list(self._packet_watch_info.items()):
-            if isinstance(packet, packet_cls):
+        # Look up each class in the MRO of the packet instead
+        # of checking the packet against each watched class,
+        # so that dispatching doesn't get more expensive the
+        # more packets are being watched for.
+        #
+        # We don't stop at the first match since there could
+        # be other packet watches for base classes as well.
+        for packet_cls in type(packet).__mro__:
+            packet_holder = self._packet_watch_info.pop(packet_cls, None)
+            if packet_holder is not None:
                 packet_holder.set(packet)
-                self._packet_watch_info.pop(packet_cls)
-
-                # Don't break here since there could be other
-                # packet watches that requested a more derived
-                # subclass of 'packet_cls'.
 
     def _cancel_packet_watches(self):
         # Make a copy of the items so we may modify
@@ -285,23 +319,34 @@ class Connection(abc.ABC):
             Whether ``packet_cls`` is being watched for.
         """
 
-        for watch_cls in self._packet_watch_info.keys():
-            if issubclass(packet_cls, watch_cls):
+        watched_classes = self._packet_watch_info
+
+        for base in packet_cls.__mro__:
+            if base in watched_classes:
                 return True
 
         return False
 
-    async def write_data(self, data):
+    async def write_data(self, data, *, drain=True):
         """Writes outgoing data to the :attr:`writer` attribute.
 
         Parameters
         ----------
         data : :class:`bytes`
             The data to write.
+        drain : :class:`bool`
+            Whether to wait until it is appropriate to resume writing.
+
+            If ``False``, or if called by the same task within
+            :meth:`write_packets`, then the data is only written, and
+            the caller is responsible for eventually draining the
+            :attr:`writer` attribute.
         """
 
         self.writer.write(data)
-        await self.writer.drain()
+
+        if drain and id(self) not in _deferred_drain_ids.get():
+            await self.writer.drain()
 
     async def write_packet(self, packet_cls, /, **fields):
         """Writes an outgoing :class:`.Packet`.
@@ -324,6 +369,32 @@ class Connection(abc.ABC):
 
         await self.write_packet_instance(self.create_packet(packet_cls, **fields))
 
+    async def write_packets(self, packets):
+        r"""Writes several outgoing :class:`.Packet` instances at once.
+
+        Each :class:`.Packet` is written with :meth:`write_packet_instance`,
+        but the :attr:`writer` attribute is only drained once after all of
+        them have been written, instead of after each one. This may increase
+        throughput when writing many :class:`.Packet`\s in a burst, at the
+        cost of not waiting on the :attr:`writer` attribute between them.
+
+        Parameters
+        ----------
+        packets : iterable of :class:`.Packet`
+            The :class:`.Packet`\s to write.
+        """
+
+        token = _deferred_drain_ids.set(_deferred_drain_ids.get() | {id(self)})
+
+        try:
+            for packet in packets:
+                await self.write_packet_instance(packet)
+
+        finally:
+            _deferred_drain_ids.reset(token)
+
+        await self.writer.drain()
+
     @abc.abstractmethod
     async def write_packet_instance(self, packet):
         """Writes an outgoing :class:`.Packet` instance.
@@ -6,9 +6,68 @@ from .. import util
 
 __all__ = [
     "ByteStreamReader",
+    "BufferedReader",
     "ByteStreamWriter",
 ]
 
+# NOTE: 'bytearray.take_bytes' was added in Python 3.15.
+_HAS_TAKE_BYTES = hasattr(bytearray, "take_bytes")
+
+def _take_from_front(buffer, n):
+    # Removes and returns up to 'n' bytes from the front of 'buffer'.
+
+    if n > len(buffer):
+        n = len(buffer)
+
+    # Detach the data from the front of the
+    # buffer in a single step when we can.
+    if _HAS_TAKE_BYTES:
+        return buffer.take_bytes(n)
+
+    # Otherwise, copy the data out through a 'memoryview'
+    # so that it's only copied once, and then delete it
+    # from the front of the buffer in place. Deleting from
+    # the front of a 'bytearray' just advances where it
+    # starts instead of moving the remaining data, so this
+    # doesn't get more expensive the more data there is
+    # left to read.
+    with memoryview(buffer) as buffer_view:
+        extracted_data = bytes(buffer_view[:n])
+
+    del buffer[:n]
+
+    return extracted_data
+
+def _normalize_separator(separator):
+    # NOTE: Support for a tuple of multiple
+    # separators was added in Python 3.13.
+
+    if not isinstance(separator, tuple):
+        return (separator,)
+
+    return separator
+
+def _find_separator_end(buffer, separator, start=0):
+    separator = _normalize_separator(separator)
+
+    match_end = None
+    for to_find in separator:
+        if len(to_find) <= 0:
+            raise ValueError("Separator must contain at least one byte")
+
+        pos = buffer.find(to_find, start)
+        if pos >= 0:
+            possible_end = pos + len(to_find)
+
+            if match_end is None:
+                match_end = possible_end
+            else:
+                match_end = min(match_end, possible_end)
+
+    # NOTE: This will return 'None' instead of '-1'
+    # to signify that we did not find any separators.
+    return match_end
+
 class ByteStreamReader:
     """An :class:`asyncio.StreamReader` which reads from predetermined data.
 
@@ -23,10 +82,25 @@ class ByteStreamReader:
     ----------
     data : bytes-like
         The data to read from.
+    copy : :class:`bool`
+        Whether to copy ``data``.
+
+        If ``False`` and ``data`` is a :class:`bytearray`,
+        then ``data`` is used directly instead of being
+        copied, and the :class:`ByteStreamReader` takes
+        ownership of it. ``data`` should then not be used
+        elsewhere, as reading will modify it.
+
+        Otherwise, ``data`` is copied.
     """
 
-    def __init__(self, data=b""):
-        self._buffer = bytearray(data)
+    __slots__ = ("_buffer",)
+
+    def __init__(self, data=b"", *, copy=True):
+        if not copy and isinstance(data, bytearray):
+            self._buffer = data
+        else:
+            self._buffer = bytearray(data)
 
     async def read(self, n=-1):
         """Reads up to ``n`` bytes.
@@ -49,10 +123,7 @@ class ByteStreamReader:
         if n < 0:
             n = len(self._buffer)
 
-        extracted_data = self._buffer[:n]
-        self._buffer   = self._buffer[n:]
-
-        return bytes(extracted_data)
+        return _take_from_front(self._buffer, n)
 
     async def readline(self):
         """Reads until the next newline.
@@ -101,30 +172,181 @@ class ByteStreamReader:
 
         return await self.read(n)
 
-    def _find_separator_end(self, separator):
-        # NOTE: Support for a tuple of multiple
-        # separators was added in Python 3.13.
+    async def readuntil(self, separator=b"\n"):
+        """Reads until a separator is found.
+
+        Parameters
+        ----------
+        separator : :class:`bytes` or :class:`tuple` of :class:`bytes`
+            If :class:`bytes`, then the separator to read until.
+
+            If a :class:`tuple`, then the collection of
+            possible separators to read until. The separator
+            which results in the least amount of data
+            being read will be the one utilized.
+
+        Returns
+        -------
+        :class:`bytes`
+            The data read from the stream.
+
+            The appropriate separator will be included in the data.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            If the separators don't all contain at least one byte.
+        :exc:`asyncio.IncompleteReadError`
+            If no separator can be found.
+
+            The ``partial`` attribute will contain the
+            partially read data, potentially including
+            part of a separator.
+        """
 
-        if not isinstance(separator, tuple):
-            separator = [separator]
+        pos = _find_separator_end(self._buffer, separator)
+        if pos is None:
+            raise asyncio.IncompleteReadError(partial=await self.read(), expected=None)
 
-        match_end = None
-        for to_find in separator:
-            if len(to_find) <= 0:
-                raise ValueError("Separator must contain at least one byte")
+        return await self.readexactly(pos)
 
-            pos = self._buffer.find(to_find)
-            if pos >= 0:
-                possible_end = pos + len(to_find)
+    def at_eof(self):
+        """Gets whether the stream has ended.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the stream has ended.
+        """
 
-                if match_end is None:
-                    match_end = possible_end
-                else:
-                    match_end = min(match_end, possible_end)
+        return len(self._buffer) == 0
 
-        # NOTE: This will return 'None' instead of '-1'
-        # to signify that we did not find any separators.
-        return match_end
+class BufferedReader:
+    r"""An :class:`asyncio.StreamReader` which buffers the data of another reader.
+
+    Reading many small amounts of data from a stream, such as
+    when reading the headers of :class:`.Packet`\s, can be
+    comparatively slow when each read has to go through to the
+    underlying stream. A :class:`BufferedReader` reads larger
+    chunks of data from its underlying reader at once, and
+    serves smaller reads from those chunks.
+
+    .. note::
+
+        While this technically does not inherit from
+        :class:`asyncio.StreamReader`, it has the same
+        API and semantics. Thus it is perfectly usable
+        for e.g. :class:`io.Connection <.Connection>`.
+
+    Parameters
+    ----------
+    reader : :class:`asyncio.StreamReader`
+        The underlying reader.
+    capacity : :class:`int`
+        How much data to read from ``reader`` at once.
+
+    Attributes
+    ----------
+    reader : :class:`asyncio.StreamReader`
+        The underlying reader.
+    capacity : :class:`int`
+        How much data to read from :attr:`reader` at once.
+    """
+
+    __slots__ = ("reader", "capacity", "_buffer")
+
+    def __init__(self, reader, *, capacity=65536):
+        self.reader   = reader
+        self.capacity = capacity
+
+        self._buffer = bytearray()
+
+    async def _fill_buffer(self, needed=0):
+        # Returns whether any more data could be read.
+
+        data = await self.reader.read(max(needed, self.capacity))
+        self._buffer.extend(data)
+
+        return len(data) > 0
+
+    async def read(self, n=-1):
+        """Reads up to ``n`` bytes.
+
+        Parameters
+        ----------
+        n : :class:`int`
+            The number of bytes to read.
+
+            If ``-1``, then read until EOF.
+
+        Returns
+        -------
+        :class:`bytes`
+            The data read from the stream.
+        """
+
+        if n < 0:
+            return _take_from_front(self._buffer, len(self._buffer)) + await self.reader.read()
+
+        if n == 0:
+            return b""
+
+        if len(self._buffer) == 0:
+            # Don't copy large reads through our buffer.
+            if n >= self.capacity:
+                return await self.reader.read(n)
+
+            await self._fill_buffer()
+
+        return _take_from_front(self._buffer, n)
+
+    async def readline(self):
+        """Reads until the next newline.
+
+        If EOF is reached before the next newline,
+        then partial data is returned.
+
+        Returns
+        -------
+        :class:`bytes`
+            The data read from the stream.
+
+            The newline will be included in the data.
+        """
+
+        try:
+            return await self.readuntil(b"\n")
+
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+
+    async def readexactly(self, n):
+        """Reads exactly ``n`` bytes.
+
+        Parameters
+        ----------
+        n : :class:`int`
+            The exact number of bytes to read.
+
+        Returns
+        -------
+        :class:`bytes`
+            The data read from the stream.
+
+        Raises
+        ------
+        :exc:`asyncio.IncompleteReadError`
+            If ``n`` bytes cannot be read.
+
+            The ``partial`` attribute will contain the
+            partially read data.
+        """
+
+        while len(self._buffer) < n:
+            if not await self._fill_buffer(n - len(self._buffer)):
+                raise asyncio.IncompleteReadError(partial=_take_from_front(self._buffer, len(self._buffer)), expected=n)
+
+        return _take_from_front(self._buffer, n)
 
     async def readuntil(self, separator=b"\n"):
         """Reads until a separator is found.
@@ -158,11 +380,24 @@ class ByteStreamReader:
             part of a separator.
         """
 
-        pos = self._find_separator_end(separator)
-        if pos is None:
-            raise asyncio.IncompleteReadError(partial=await self.read(), expected=None)
+        separator = _normalize_separator(separator)
 
-        return await self.readexactly(pos)
+        # Don't search through data we've already searched
+        # through each time we read more data, but make sure
+        # we can still find a separator which straddles the
+        # old and new data.
+        max_separator_length = max((len(to_find) for to_find in separator), default=1)
+
+        search_start = 0
+        while True:
+            pos = _find_separator_end(self._buffer, separator, search_start)
+            if pos is not None:
+                return _take_from_front(self._buffer, pos)
+
+            search_start = max(0, len(self._buffer) - max_separator_length + 1)
+
+            if not await self._fill_buffer():
+                raise asyncio.IncompleteReadError(partial=_take_from_front(self._buffer, len(self._buffer)), expected=None)
 
     def at_eof(self):
         """Gets whether the stream has ended.
@@ -173,7 +408,7 @@ class ByteStreamReader:
             Whether the stream has ended.
         """
 
-        return len(self._buffer) == 0
+        return len(self._buffer) == 0 and self.reader.at_eof()
 
 class ByteStreamWriter:
     """An :class:`asyncio.StreamWriter` which writes to an internal buffer.
@@ -186,10 +421,15 @@ class ByteStreamWriter:
         for e.g. :class:`io.Connection <.Connection>`.
     """
 
+    __slots__ = ("_buffer", "_closed", "_close_waiters")
+
     def __init__(self):
         self._buffer = bytearray()
 
-        self._close_event = asyncio.Event()
+        # Each task waiting for closing gets its own future
+        # so that cancelling one doesn't affect the others.
+        self._closed        = False
+        self._close_waiters = []
 
     @property
     def written_data(self):
@@ -226,7 +466,12 @@ class ByteStreamWriter:
             The iterable of bytes to write.
         """
 
-        self.write(b"".join(data))
+        # Extend the buffer with each chunk instead of
+        # joining them together first to avoid making an
+        # intermediate copy of all the data.
+        buffer = self._buffer
+        for chunk in data:
+            buffer.extend(chunk)
 
     async def drain(self):
         """Waits until it is appropriate to resume writing to the :class:`ByteStreamWriter`."""
@@ -239,7 +484,11 @@ class ByteStreamWriter:
         This method should be used along with the :meth:`wait_closed` method.
         """
 
-        self._close_event.set()
+        self._closed = True
+
+        for waiter in self._close_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
 
     def is_closing(self):
         """Gets whether the :class:`ByteStreamWriter` is closed or in the process of closing.
@@ -250,9 +499,19 @@ class ByteStreamWriter:
             Whether the :class:`ByteStreamWriter` is closed or in the process of closing.
         """
 
-        return self._close_event.is_set()
+        return self._closed
 
     async def wait_closed(self):
         """Waits until the :class:`ByteStreamWriter` is closed."""
 
-        await self._close_event.wait()
+        if self._closed:
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._close_waiters.append(waiter)
+
+        try:
+            await waiter
+
+        finally:
+            self._close_waiters.remove(waiter)
@@ -1,5 +1,7 @@
 r""":class:`.Packet`\s which align their fields."""
 
+import struct
+
 from .. import io
 from .. import util
 from ..types.type import Type
@@ -12,7 +14,7 @@ __all__ = [
 ]
 
 class AlignedPacket(Packet):
-    """A :class:`.Packet` which aligns its fields.
+    r"""A :class:`.Packet` which aligns its fields.
 
     The fields of an :class:`AlignedPacket` are aligned in the
     same way the fields of a struct would be in  C or C++, including
@@ -21,11 +23,33 @@ class AlignedPacket(Packet):
     The header of an :class:`AlignedPacket` is not taken into account
     when aligning fields.
 
+    If ``align_optimize=True`` is passed when subclassing, then the fields
+    are marshaled in order of descending alignment, keeping the declared
+    order between fields of the same alignment, so that as little padding
+    as possible is needed. The order of the fields as attributes is unchanged.
+    Subclasses inherit this setting unless they pass it themselves.
+
     .. warning::
 
         An :class:`AlignedPacket` must have at least one field to be used in full.
+
+    Examples
+    --------
+    >>> import pak
+    >>> class MyPacket(pak.AlignedPacket, align_optimize=True):
+    ...     first:  pak.Int16
+    ...     second: pak.Int32
+    ...     third:  pak.Int8
+    ...
+    >>> MyPacket.size()
+    8
+    >>> # The '\xAA' byte represents alignment padding.
+    >>> MyPacket.unpack(b"\x02\x00\x00\x00\x01\x00\x03\xAA")
+    MyPacket(first=1, second=2, third=3)
     """
 
+    _align_optimize = False
+
     # NOTE: We currently decline to add an 'align_as' feature.
     #
     # I think there's too much to think about to justify adding
@@ -47,6 +71,298 @@ class AlignedPacket(Packet):
     #   'align_as' attribute?
     # - Should individual fields be able to have 'align_as' applied to them?
 
+    def __init_subclass__(cls, *, align_optimize=None, **kwargs):
+        # NOTE: We set this before calling 'super().__init_subclass__'
+        # so that it's in place when our marshaling functions
+        # are generated by 'Packet.__init_subclass__'.
+        if align_optimize is not None:
+            cls._align_optimize = align_optimize
+
+        super().__init_subclass__(**kwargs)
+
+    @classmethod
+    @util.cache
+    def _wire_fields(cls):
+        # Returns the fields and their types in the
+        # order that they are marshaled in.
+
+        fields = tuple(cls.enumerate_field_types())
+        if not cls._align_optimize:
+            return fields
+
+        # NOTE: 'sorted' is stable, even when reversed.
+        return tuple(sorted(fields, key=lambda field: field[1].alignment(), reverse=True))
+
+    @classmethod
+    def _generate_marshal_methods(cls):
+        # Overrides 'Packet._generate_marshal_methods' to
+        # generate functions which handle alignment padding.
+        #
+        # Most fields have no padding after them, and so we
+        # skip reading any padding for them entirely.
+
+        namespace = dict(
+            file_object          = util.file_object,
+            BufferOutOfDataError = util.BufferOutOfDataError,
+        )
+
+        unpack_body = [
+            "self      = object.__new__(cls)",
+            "self_dict = self.__dict__",
+            "",
+            "buf = file_object(buf)",
+            "",
+            "type_ctx = self.type_ctx(ctx)",
+        ]
+
+        packed_fields = []
+
+        fields         = list(cls._wire_fields())
+        static_padding = cls._static_padding_lengths([field_type for _, field_type in fields])
+
+        # When the padding can't depend on the context, we
+        # inline it as constants instead of looking it up.
+        if static_padding is None and len(fields) > 0:
+            unpack_body.append("padding_lengths = cls._padding_lengths(ctx=type_ctx.packet_ctx)")
+
+        for i, (field, field_type) in enumerate(fields):
+            namespace[f"field_type_{i}"] = field_type
+
+            unpack_body += [
+                "",
+                f"value = field_type_{i}.unpack(buf, ctx=type_ctx)",
+            ]
+
+            packed_fields.append(f"field_type_{i}.pack(self.{field}, ctx=type_ctx)")
+
+            if static_padding is None:
+                unpack_body += [
+                    "",
+                    f"padding_amount = padding_lengths[{i}]",
+                    "if padding_amount > 0 and len(buf.read(padding_amount)) < padding_amount:",
+                    "    raise BufferOutOfDataError('Unable to read enough padding for alignment')",
+                ]
+
+                packed_fields.append(f"padding[{i}]")
+
+            elif static_padding[i] > 0:
+                unpack_body += [
+                    "",
+                    f"if len(buf.read({static_padding[i]})) < {static_padding[i]}:",
+                    "    raise BufferOutOfDataError('Unable to read enough padding for alignment')",
+                ]
+
+                packed_fields.append(repr(bytes(static_padding[i])))
+
+            unpack_body.append("")
+            unpack_body += cls._field_assignment(field, "value")
+
+        unpack_body.append("return self")
+
+        pack_body = ["type_ctx = self.type_ctx(ctx)"]
+        if static_padding is None and len(fields) > 0:
+            pack_body.append("padding = self._padding(ctx=type_ctx.packet_ctx)")
+
+        pack_body.append(f"return b''.join(({''.join(f'{packed}, ' for packed in packed_fields)}))")
+
+        unpack_fields = util.generate_function(
+            "_unpack_fields", "cls, buf, ctx",
+
+            unpack_body,
+
+            namespace = namespace,
+            qualname  = f"{cls.__qualname__}._unpack_fields",
+            module    = cls.__module__,
+        )
+
+        pack_fields = util.generate_function(
+            "_pack_fields", "self, ctx",
+
+            pack_body,
+
+            namespace = namespace,
+            qualname  = f"{cls.__qualname__}._pack_fields",
+            module    = cls.__module__,
+        )
+
+        # When the padding is static, so are the sizes of
+        # our fields, and so the size of the whole packet.
+        if static_padding is None:
+            cls._constant_size = None
+        else:
+            cls._constant_size = sum(field_type._size for _, field_type in fields) + sum(static_padding)
+
+        unpack_many_body = [
+            "buf = file_object(buf)",
+            "",
+            "return [unpack_fields(cls, buf, ctx) for _ in range(count)]",
+        ]
+
+        fields_struct = cls._fields_struct(fields)
+        if fields_struct is not None:
+            # When every field is a plain 'StructType', the fields
+            # and their padding can be marshaled with one compiled
+            # 'struct.Struct', whose format uses 'x' for padding.
+            #
+            # If there is not enough data, then we defer to the
+            # generic function to raise the appropriate error.
+            #
+            # When we're given raw data directly, we unpack from
+            # it in place rather than wrapping it in a file object.
+
+            namespace = dict(
+                file_object           = util.file_object,
+                struct_error          = struct.error,
+                fields_struct         = fields_struct,
+                generic_unpack_fields = unpack_fields,
+                generic_pack_fields   = pack_fields,
+            )
+
+            values = "".join(f"value_{i}, " for i in range(len(fields)))
+
+            unpack_body = [
+                "self      = object.__new__(cls)",
+                "self_dict = self.__dict__",
+                "",
+                f"if isinstance(buf, (bytes, bytearray)) and len(buf) >= {fields_struct.size}:",
+                f"    {values}= fields_struct.unpack_from(buf)",
+                "else:",
+                f"    data = file_object(buf).read({fields_struct.size})",
+                f"    if len(data) < {fields_struct.size}:",
+                "        return generic_unpack_fields(cls, data, ctx)",
+                "",
+                f"    {values}= fields_struct.unpack(data)",
+            ]
+
+            for i, (field, _) in enumerate(fields):
+                unpack_body.append("")
+                unpack_body += cls._field_assignment(field, f"value_{i}")
+
+            unpack_body.append("return self")
+
+            unpack_fields = util.generate_function(
+                "_unpack_fields", "cls, buf, ctx",
+
+                unpack_body,
+
+                namespace = namespace,
+                qualname  = f"{cls.__qualname__}._unpack_fields",
+                module    = cls.__module__,
+            )
+
+            # To unpack multiple packets we read all their
+            # data at once and iterate over the unpacked values.
+            unpack_many_body = [
+                f"size = {fields_struct.size} * count",
+                "",
+                "data = file_object(buf).read(size)",
+                "if len(data) < size:",
+                "    buf = file_object(data)",
+                "",
+                "    return [generic_unpack_fields(cls, buf, ctx) for _ in range(count)]",
+                "",
+                "packets = []",
+                f"for {values}in fields_struct.iter_unpack(data):",
+                "    self      = object.__new__(cls)",
+                "    self_dict = self.__dict__",
+            ]
+
+            for i, (field, _) in enumerate(fields):
+                unpack_many_body.append("")
+                unpack_many_body += [f"    {line}" for line in cls._field_assignment(field, f"value_{i}")]
+
+            unpack_many_body += [
+                "",
+                "    packets.append(self)",
+                "",
+                "return packets",
+            ]
+
+            # If packing all the fields at once fails, then we
+            # defer to the generic function, since each field's
+            # type may accept values which 'struct' on its own
+            # would not, such as iterables of values.
+            pack_body = [
+                "try:",
+                f"    return fields_struct.pack({''.join(f'self.{field}, ' for field, _ in fields)})",
+                "except struct_error:",
+                "    return generic_pack_fields(self, ctx)",
+            ]
+
+            pack_fields = util.generate_function(
+                "_pack_fields", "self, ctx",
+
+                pack_body,
+
+                namespace = namespace,
+                qualname  = f"{cls.__qualname__}._pack_fields",
+                module    = cls.__module__,
+            )
+
+        cls._unpack_fields = classmethod(unpack_fields)
+
+        namespace["unpack_fields"] = unpack_fields
+
+        cls._unpack_many_fields = classmethod(util.generate_function(
+            "_unpack_many_fields", "cls, buf, count, ctx",
+
+            unpack_many_body,
+
+            namespace = namespace,
+            qualname  = f"{cls.__qualname__}._unpack_many_fields",
+            module    = cls.__module__,
+        ))
+
+        cls._pack_fields = pack_fields
+
+    @classmethod
+    def _static_padding_lengths(cls, field_types):
+        # Returns the padding lengths after each of 'field_types'
+        # if they can't depend on the context, else 'None'.
+
+        if len(field_types) == 0:
+            return None
+
+        # If the alignment of the packet has been customized
+        # then we can't know that it doesn't depend on the context.
+        if cls.alignment.__func__ is not AlignedPacket.__dict__["alignment"].__func__:
+            return None
+
+        # Sizes and alignments given by a method or 'DynamicValue'
+        # could depend on the context, and so can't be made static.
+        for field_type in field_types:
+            if not isinstance(field_type._size, int) or not isinstance(field_type._alignment, int):
+                return None
+
+        return tuple(Type.alignment_padding_lengths(
+            *field_types,
+
+            total_alignment = max(field_type._alignment for field_type in field_types),
+        ))
+
+    @classmethod
+    def _fields_struct(cls, fields):
+        # Returns a 'struct.Struct' for marshaling all our fields
+        # at once, or 'None' if our fields can't be marshaled so.
+
+        field_types = [field_type for _, field_type in fields]
+
+        padding_lengths = cls._static_padding_lengths(field_types)
+        if padding_lengths is None:
+            return None
+
+        endians = {cls._struct_field_endian(field_type) for field_type in field_types}
+        if len(endians) != 1 or None in endians:
+            return None
+
+        fmt = "".join(
+            field_type.fmt + "x" * padding_amount
+
+            for field_type, padding_amount in zip(field_types, padding_lengths)
+        )
+
+        return struct.Struct(endians.pop() + fmt)
+
     @classmethod
     @util.cache
     def alignment(cls, *, ctx=None):
@@ -75,47 +391,80 @@ class AlignedPacket(Packet):
         """
 
         if ctx is None:
-            ctx = cls.Context()
+            ctx = cls._default_ctx()
 
         type_ctx = Type.Context(ctx=ctx)
 
         return max(t.alignment(ctx=type_ctx) for t in cls.field_types())
 
     @classmethod
-    def _padding_lengths(cls, *, type_ctx):
-        return Type.alignment_padding_lengths(
-            *cls.field_types(),
+    @util.cache
+    def _padding_lengths(cls, *, ctx):
+        # NOTE: The padding lengths only depend on the static
+        # sizes and alignments of our field types, which do
+        # not depend on any particular packet, so we only need
+        # to cache them for each packet context and not each
+        # type context, which would contain the packet.
+
+        type_ctx = Type.Context(ctx=ctx)
+
+        return tuple(Type.alignment_padding_lengths(
+            *[field_type for _, field_type in cls._wire_fields()],
 
-            total_alignment = cls.alignment(ctx=type_ctx.packet_ctx),
+            total_alignment = cls.alignment(ctx=ctx),
             ctx             = type_ctx,
-        )
+        ))
 
     @classmethod
-    def unpack(cls, buf, *, ctx=None):
-        """Overrides :meth:`.Packet.unpack` to handle alignment padding."""
+    @util.cache
+    def _padding(cls, *, ctx):
+        # The padding after each field, cached so
+        # that it isn't created anew for every pack.
+        return tuple(bytes(padding_amount) for padding_amount in cls._padding_lengths(ctx=ctx))
 
-        self = object.__new__(cls)
+    @classmethod
+    def unpack_many(cls, buf, count, *, ctx=None):
+        r"""Unpacks multiple consecutive :class:`AlignedPacket`\s, without their headers.
 
-        buf = util.file_object(buf)
+        This is equivalent to calling :meth:`unpack` ``count``
+        times on the same buffer, but may be much faster, as
+        the data for all the packets may be read and unpacked
+        at once.
 
-        type_ctx = self.type_ctx(ctx)
-        for (field, field_type), padding_amount in zip(cls.enumerate_field_types(), cls._padding_lengths(type_ctx=type_ctx)):
-            value = field_type.unpack(buf, ctx=type_ctx)
+        Parameters
+        ----------
+        buf : file object or :class:`bytes` or :class:`bytearray`
+            The buffer containing the raw data.
+        count : :class:`int`
+            The number of packets to unpack.
+        ctx : :class:`.Packet.Context` or ``None``
+            The context for the :class:`AlignedPacket`\s.
 
-            # Read out the padding data and check we read enough.
-            if len(buf.read(padding_amount)) < padding_amount:
-                raise util.BufferOutOfDataError("Unable to read enough padding for alignment")
+        Returns
+        -------
+        :class:`list`
+            The unpacked :class:`AlignedPacket`\s.
 
-            try:
-                setattr(self, field, value)
+        Examples
+        --------
+        >>> import pak
+        >>> class MyPacket(pak.AlignedPacket):
+        ...     first:  pak.Int8
+        ...     second: pak.Int16
+        ...
+        >>> # The '\xAA' byte represents alignment padding.
+        >>> MyPacket.unpack_many(b"\x01\xAA\x02\x00\x03\xAA\x04\x00", 2)
+        [MyPacket(first=1, second=2), MyPacket(first=3, second=4)]
+        """
 
-            except AttributeError:
-                # If trying to set an unpacked value fails
-                # (like if the attribute is read-only)
-                # then just move on.
-                pass
+        # If 'unpack' has been overridden, then we must use
+        # it to stay equivalent to calling it repeatedly.
+        if cls.unpack.__func__ is not Packet.unpack.__func__:
+            buf = util.file_object(buf)
 
-        return self
+            return [cls.unpack(buf, ctx=ctx) for _ in range(count)]
+
+        return cls._unpack_many_fields(buf, count, ctx)
 
     @classmethod
     async def unpack_async(cls, reader, *, ctx=None):
@@ -127,7 +476,7 @@ class AlignedPacket(Packet):
             reader = io.ByteStreamReader(reader)
 
         type_ctx = self.type_ctx(ctx)
-        for (field, field_type), padding_amount in zip(cls.enumerate_field_types(), cls._padding_lengths(type_ctx=type_ctx)):
+        for (field, field_type), padding_amount in zip(cls._wire_fields(), cls._padding_lengths(ctx=type_ctx.packet_ctx)):
             value = await field_type.unpack_async(reader, ctx=type_ctx)
 
             await reader.readexactly(padding_amount)
@@ -143,33 +492,38 @@ class AlignedPacket(Packet):
 
         return self
 
-    def pack_without_header(self, *, ctx=None):
-        """Overrides :meth:`.Packet.pack_without_header` to handle alignment padding."""
-
-        type_ctx = self.type_ctx(ctx)
-
-        return b"".join(
-            field_type.pack(value, ctx=type_ctx) + b"\x00" * padding_amount
-
-            for (field_type, value), padding_amount in zip(self.field_types_and_values(), self._padding_lengths(type_ctx=type_ctx))
-        )
+    @classmethod
+    @util.cache
+    def _static_size(cls, *, ctx):
+        # The static size of an 'AlignedPacket' can't change
+        # for the same context, so we only calculate it once.
+        return super()._static_size(ctx=ctx) + sum(cls._padding_lengths(ctx=ctx))
 
     @util.class_or_instance_method
     def size(cls, *, ctx=None):
         """Overrides :meth:`.Packet.size` to handle alignment padding."""
 
-        if ctx is None:
-            ctx = cls.Context()
+        if cls._constant_size is not None:
+            return cls._constant_size
 
-        type_ctx = Type.Context(ctx=ctx)
+        if ctx is None:
+            ctx = cls._default_ctx()
 
-        return super().size(ctx=ctx) + sum(cls._padding_lengths(type_ctx=type_ctx))
+        return cls._static_size(ctx=ctx)
 
     @size.instance_method
     def size(self, *, ctx=None):
-        type_ctx = self.type_ctx(ctx)
+        if self._constant_size is not None:
+            return self._constant_size
+
+        if ctx is None:
+            ctx = self._default_ctx()
+
+        return super().size(ctx=ctx) + sum(self._padding_lengths(ctx=ctx))
 
-        return super().size(ctx=ctx) + sum(self._padding_lengths(type_ctx=type_ctx))
+# Generate the marshaling functions for 'AlignedPacket' itself
+# since '__init_subclass__' is only called for its subclasses.
+AlignedPacket._generate_marshal_methods()
 
 class AlignedHeader(Packet.Header, AlignedPacket):
     r"""A :class:`.Packet.Header` which aligns its fields.
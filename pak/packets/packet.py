@@ -2,12 +2,14 @@ r"""Base code for :class:`.Packet`\s."""
 
 import copy
 import inspect
+import struct
+import types
 
 from .. import io
 from .. import util
 from ..dyn_value import DynamicValue
 from ..types.type import Type
-from ..types.misc import RawByte
+from ..types.misc import RawByte, StructType
 
 __all__ = [
     "ReservedFieldError",
@@ -55,14 +57,14 @@ class DuplicateFieldError(Exception):
 @classmethod
 def _id_wrapper_classmethod(cls, *, ctx=None):
     if ctx is None:
-        ctx = cls.Context()
+        ctx = cls._default_ctx()
 
     return cls._wrapped_id(ctx=ctx)
 
 @classmethod
 def _id_wrapper_dynamic_value(cls, *, ctx=None):
     if ctx is None:
-        ctx = cls.Context()
+        ctx = cls._default_ctx()
 
     return cls._wrapped_id.get(ctx=ctx)
 
@@ -70,6 +72,17 @@ def _id_wrapper_dynamic_value(cls, *, ctx=None):
 def _id_wrapper_static_value(cls, *, ctx=None):
     return cls._wrapped_id
 
+# The types of values which 'Packet.copy' need not deep copy.
+_atomic_types = frozenset({
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+})
+
 class Packet:
     r"""A collection of values that can be marshaled to and from
     raw data using :class:`.Type`\s.
@@ -188,7 +201,8 @@ class Packet:
 
         When no :class:`Packet.Context` is provided to :class:`Packet`
         operations that may accept one, then your subclass is attempted
-        to be default constructed and used instead.
+        to be default constructed and used instead. Once successfully
+        constructed, that default context is reused for later operations.
 
         .. warning::
 
@@ -216,11 +230,14 @@ class Packet:
         # problem, and think of the best API for it, which would require
         # users who are not me to chime in.
 
+        # Set to 'True' on instances once they're constructed.
+        _immutable_flag = False
+
         def __init__(self):
             self._immutable_flag = True
 
         def __setattr__(self, attr, value):
-            if hasattr(self, "_immutable_flag"):
+            if self._immutable_flag:
                 raise TypeError(f"'{type(self).__qualname__}' is immutable")
 
             super().__setattr__(attr, value)
@@ -240,8 +257,10 @@ class Packet:
     # The fields dictionary for 'Packet'.
     #
     # Since 'Packet' has no annotations, and has no parent to fall back on
-    # for its fields, we define it here.
-    _fields = {}
+    # for its fields, we define it here, along with the other attributes
+    # set by '_init_fields_from_annotations'.
+    _fields        = {}
+    _field_origins = {}
 
     # Will be replaced after 'Packet' is defined.
     #
@@ -269,6 +288,18 @@ class Packet:
         "ctx",
     ]
 
+    _all_reserved_fields = frozenset(RESERVED_FIELDS)
+
+    # Set properly for subclasses in '_init_static_header'.
+    _has_static_header = False
+
+    # Set to 'True' on instances by 'make_immutable'.
+    #
+    # Having a class-level default lets '__setattr__' check
+    # the flag with a plain lookup rather than 'hasattr',
+    # which would raise and catch an exception every time.
+    _immutable_flag = False
+
     @classmethod
     def _id_wrapper(cls, *, ctx=None):
         return None
@@ -340,8 +371,12 @@ class Packet:
 
         return cls._id_wrapper(ctx=ctx)
 
+    # NOTE: The caches of 'GenericWithID' and 'EmptyWithID' are
+    # typed so that e.g. an ID of 'True' doesn't get the class
+    # generated for an ID of '1', which would have the wrong 'id'.
+
     @classmethod
-    @util.cache
+    @util.cache(typed=True)
     def GenericWithID(cls, id, /):
         r"""Generates a subclass of the :class:`Packet` class and :class:`GenericPacket` with the specified ID.
 
@@ -350,7 +385,7 @@ class Packet:
             This method is decorated with :func:`util.cache() <.decorators.cache>`.
 
             This means that when called twice with the same ID,
-            then the exact same class will be returned.
+            of the same type, then the exact same class will be returned.
 
         :class:`GenericPacket` will be inherited from such that
         its ``data`` field will be after all the fields of the
@@ -396,7 +431,7 @@ class Packet:
         ))
 
     @classmethod
-    @util.cache
+    @util.cache(typed=True)
     def EmptyWithID(cls, id, /):
         r"""Generates an empty subclass of the :class:`Packet` class with the specified ID.
 
@@ -405,7 +440,7 @@ class Packet:
             This method is decorated with :func:`util.cache() <.decorators.cache>`.
 
             This means that when called twice with the same ID,
-            then the exact same class will be returned.
+            of the same type, then the exact same class will be returned.
 
         Parameters
         ----------
@@ -502,30 +537,41 @@ class Packet:
         # remove or fundamentally alter these things,
         # packet fields being slots will remain unimplemented.
 
+        # Our base Packets have already aggregated the reserved
+        # fields and collected the fields of their own bases,
+        # so we only need to look at our direct bases.
+        packet_bases = [base for base in cls.__bases__ if issubclass(base, Packet)]
+
         # Aggregate reserved fields first.
         reserved_fields = set(cls.RESERVED_FIELDS)
-        for base in cls.mro()[1:]:
-            if not issubclass(base, Packet):
-                continue
-
-            reserved_fields.update(base.RESERVED_FIELDS)
+        for base in packet_bases:
+            reserved_fields.update(base._all_reserved_fields)
 
+        cls._all_reserved_fields = frozenset(reserved_fields)
 
         cls._fields = {}
 
-        # Collect fields of base Packets beforehand.
-        for base in cls.mro()[1:]:
-            if not issubclass(base, Packet):
-                continue
+        # The classes which each field was declared in.
+        cls._field_origins = {}
 
+        # Collect fields of base Packets beforehand.
+        for base in packet_bases:
             for attr, attr_type in base.enumerate_field_types():
                 if attr in reserved_fields:
                     raise ReservedFieldError(cls, attr)
 
+                origin = base._field_origins[attr]
+
                 if attr in cls._fields:
+                    # The same field may be inherited through
+                    # multiple bases, like with diamond inheritance.
+                    if cls._field_origins[attr] is origin:
+                        continue
+
                     raise DuplicateFieldError(cls, attr)
 
-                cls._fields[attr] = attr_type
+                cls._fields[attr]        = attr_type
+                cls._field_origins[attr] = origin
 
         # Collect fields of the new Packet.
         annotations = util.annotations(cls)
@@ -538,7 +584,8 @@ class Packet:
 
             real_type = Type(attr_type)
 
-            cls._fields[attr] = real_type
+            cls._fields[attr]        = real_type
+            cls._field_origins[attr] = cls
 
             # Only add the Type descriptor
             # if there isn't already something
@@ -554,38 +601,380 @@ class Packet:
                 setattr(cls, attr, descriptor)
 
     @classmethod
-    def __init_subclass__(cls, **kwargs):
-        super().__init_subclass__(**kwargs)
+    def _init_static_header(cls):
+        # When the header can only ever be packed to the
+        # same data for each context, we cache that data
+        # instead of constructing and packing a header
+        # every time we pack a packet.
+        #
+        # This is the case when the header has no fields,
+        # or when it only has the ID field and our ID is static,
+        # and neither we nor the header customize how the header
+        # gets its fields.
 
-        cls._init_id()
-        cls._init_fields_from_annotations()
+        header = cls.Header
 
-    def __init__(self, /, *, ctx=None, **fields):
-        # Lazy initialized when needed.
-        type_ctx = None
+        # 'Packet.Header' itself is created while its
+        # placeholder in 'Packet' is still in place.
+        if not issubclass(header, Packet):
+            return
 
-        for attr, attr_type in self.enumerate_field_types():
-            if attr in fields:
-                setattr(self, attr, fields.pop(attr))
+        cls._has_static_header = (
+            cls.header is Packet.header and
+
+            header.__init__ is Packet.Header.__init__ and
+
+            (
+                header._generate_fields_from_packet_method.__func__ is
+                Packet.Header._generate_fields_from_packet_method.__func__
+            ) and
+
+            (
+                len(header.field_names()) == 0 or
+
+                (
+                    tuple(header.field_names()) == ("id",) and
+                    inspect.getattr_static(cls, "_id_wrapper") is _id_wrapper_static_value
+                )
+            )
+        )
+
+    @classmethod
+    def _field_assignment(cls, field, value, *, ignore_failure=True):
+        # Returns the lines of code which set a value to
+        # a field of 'self' in a generated function, where
+        # 'self_dict' is the '__dict__' of 'self'.
+        #
+        # For fields which are plain 'Type' descriptors we write
+        # straight to where the descriptor stores its value,
+        # avoiding going through '__setattr__' and the descriptor.
+        #
+        # If 'ignore_failure' is true, then failing to set the
+        # field (like if the attribute is read-only) is ignored,
+        # and read-only properties are skipped entirely.
+        #
+        # When failure is ignored, 'value' should be a plain
+        # variable so that the expression producing it is always
+        # evaluated, and so that only the assignment is guarded.
+
+        descriptor = inspect.getattr_static(cls, field, None)
+
+        if (
+            cls.__setattr__ is Packet.__setattr__ and
+
+            isinstance(descriptor, Type) and
+            type(descriptor).__get__ is Type.__get__ and
+            type(descriptor).__set__ is Type.__set__
+        ):
+            return [f"self_dict[{descriptor.mangled_name!r}] = {value}"]
+
+        if not ignore_failure:
+            return [f"self.{field} = {value}"]
+
+        if isinstance(descriptor, property) and descriptor.fset is None:
+            return []
+
+        return [
+            "try:",
+            f"    self.{field} = {value}",
+            "except AttributeError:",
+            "    pass",
+        ]
+
+    @staticmethod
+    def _struct_field_endian(field_type):
+        # Returns the endianness of 'field_type' if it can be
+        # marshaled as part of a larger 'struct.Struct' along
+        # with other fields of the same endianness, else 'None'.
+
+        if not isinstance(field_type, type) or not issubclass(field_type, StructType):
+            return None
+
+        # If the marshaling of the type has been customized
+        # then we can't know that plain 'struct' usage matches.
+        if field_type._unpack.__func__ is not StructType._unpack.__func__:
+            return None
+
+        if field_type._pack.__func__ is not StructType._pack.__func__:
+            return None
+
+        # Types which marshal multiple values at once
+        # can't be mapped onto a single attribute.
+        if len(field_type._struct.unpack(bytes(field_type._struct.size))) != 1:
+            return None
+
+        # NOTE: The native '@' endianness inserts its own
+        # alignment padding, and so is also excluded.
+        if field_type.endian not in "<>=!":
+            return None
+
+        return field_type.endian
+
+    @classmethod
+    def _generate_init_method(cls):
+        # Since the fields of a 'Packet' are fixed, we generate
+        # a function to initialize them which is specialized to
+        # those fields, avoiding looping over the fields at every
+        # construction.
+        #
+        # '__init__' calls this function so that it still works
+        # properly when overridden and called through 'super()'.
+
+        namespace = {}
+
+        body = [
+            "self_dict = self.__dict__",
+            "",
+            "# Lazy initialized when needed.",
+            "type_ctx = None",
+        ]
+
+        for i, (field, field_type) in enumerate(cls.enumerate_field_types()):
+            namespace[f"field_type_{i}"] = field_type
+
+            body += [
+                "",
+                f"if {field!r} in fields:",
+                *[f"    {line}" for line in cls._field_assignment(field, f"fields.pop({field!r})", ignore_failure=False)],
+                "else:",
+                "    if type_ctx is None:",
+                "        type_ctx = self.type_ctx(ctx)",
+                "",
+                f"    value = field_type_{i}.default(ctx=type_ctx)",
+                *[f"    {line}" for line in cls._field_assignment(field, "value")],
+            ]
+
+        body += [
+            "",
+            "# All the fields should be used up by",
+            "# now because we pop them out.",
+            "if len(fields) > 0:",
+            "    raise TypeError(f\"Unexpected keyword arguments for '{type(self).__qualname__}': {fields}\")",
+        ]
+
+        cls._initialize_fields = util.generate_function(
+            "_initialize_fields", "self, ctx, fields",
+
+            body,
+
+            namespace = namespace,
+            qualname  = f"{cls.__qualname__}._initialize_fields",
+            module    = cls.__module__,
+        )
+
+    @classmethod
+    def _generate_comparison_methods(cls):
+        # Like with '_generate_init_method', we generate functions
+        # to compare and represent our fields which are specialized
+        # to those fields, and which '__eq__' and '__repr__' call.
+
+        field_names = list(cls.field_names())
+
+        eq_body = []
+        for field in field_names:
+            eq_body += [
+                f"if not self.{field} == other.{field}:",
+                "    return False",
+                "",
+            ]
+
+        eq_body.append("return True")
+
+        cls._fields_equal = util.generate_function(
+            "_fields_equal", "self, other",
+
+            eq_body,
+
+            qualname = f"{cls.__qualname__}._fields_equal",
+            module   = cls.__module__,
+        )
+
+        fields_repr = ", ".join(f"{field}={{self.{field}!r}}" for field in field_names)
+
+        cls._fields_repr = util.generate_function(
+            "_fields_repr", "self",
+
+            [f"return f{fields_repr!r}"],
+
+            qualname = f"{cls.__qualname__}._fields_repr",
+            module   = cls.__module__,
+        )
+
+    @classmethod
+    def _generate_size_method(cls):
+        # Like with '_generate_init_method', we generate a
+        # function to get the size of our fields which is
+        # specialized to those fields.
+        #
+        # The sizes of fields whose types have a plain 'int'
+        # for their '_size' can't depend on their values,
+        # and so are folded into a single constant.
+
+        namespace = {}
+
+        constant_size = 0
+        field_sizes   = []
+        for i, (field, field_type) in enumerate(cls.enumerate_field_types()):
+            if isinstance(field_type._size, int) and field_type.size.__func__ is Type.size.__func__:
+                constant_size += field_type._size
 
                 continue
 
-            if type_ctx is None:
-                type_ctx = self.type_ctx(ctx)
+            namespace[f"field_type_{i}"] = field_type
 
-            default = attr_type.default(ctx=type_ctx)
-            try:
-                setattr(self, attr, default)
-            except AttributeError:
-                # If trying to set a default fails
-                # (like if the attribute is read-only)
-                # then just move on.
-                pass
+            field_sizes.append(f"field_type_{i}.size(self.{field}, ctx=type_ctx)")
+
+        if len(field_sizes) == 0:
+            body = [f"return {constant_size}"]
+        else:
+            body = [
+                "type_ctx = self.type_ctx(ctx)",
+                "",
+                f"return {constant_size}{''.join(f' + {size}' for size in field_sizes)}",
+            ]
+
+        cls._fields_size = util.generate_function(
+            "_fields_size", "self, ctx",
+
+            body,
 
-        # All the fields should be used up by the end of the
-        # above loop because we pop them out.
-        if len(fields) > 0:
-            raise TypeError(f"Unexpected keyword arguments for '{type(self).__qualname__}': {fields}")
+            namespace = namespace,
+            qualname  = f"{cls.__qualname__}._fields_size",
+            module    = cls.__module__,
+        )
+
+    @classmethod
+    def _generate_marshal_methods(cls):
+        # Like with '_generate_init_method', we generate
+        # functions to unpack and pack our fields which
+        # are specialized to those fields.
+        #
+        # The public 'unpack' and 'pack_without_header' methods
+        # call these functions so that they still work properly
+        # when overridden and called through 'super()'.
+        #
+        # Subclasses may override this method to generate
+        # functions which marshal their fields differently.
+
+        namespace = dict(
+            file_object  = util.file_object,
+            struct_error = struct.error,
+        )
+
+        unpack_body = [
+            "self      = object.__new__(cls)",
+            "self_dict = self.__dict__",
+            "",
+            "buf = file_object(buf)",
+            "",
+            "type_ctx = self.type_ctx(ctx)",
+        ]
+
+        pack_body = [
+            "type_ctx = self.type_ctx(ctx)",
+        ]
+
+        packed_fields = []
+
+        # Consecutive fields which can be marshaled with 'struct'
+        # are grouped into runs, and each run of more than one
+        # field is marshaled with a single 'struct.Struct'.
+
+        runs = []
+        for i, (field, field_type) in enumerate(cls.enumerate_field_types()):
+            endian = cls._struct_field_endian(field_type)
+
+            if endian is not None and len(runs) > 0 and runs[-1][0] == endian:
+                runs[-1][1].append((i, field, field_type))
+            else:
+                runs.append((endian, [(i, field, field_type)]))
+
+        for endian, run in runs:
+            if endian is not None and len(run) > 1:
+                run_struct = struct.Struct(endian + "".join(field_type.fmt for _, _, field_type in run))
+
+                first_index = run[0][0]
+                namespace[f"run_struct_{first_index}"] = run_struct
+
+                unpack_body += [
+                    "",
+                    f"{''.join(f'value_{i}, ' for i, _, _ in run)}= run_struct_{first_index}.unpack(buf.read({run_struct.size}))",
+                ]
+
+                for i, field, field_type in run:
+                    namespace[f"field_type_{i}"] = field_type
+
+                    unpack_body += cls._field_assignment(field, f"value_{i}")
+
+                # If packing the whole run fails, then we fall back to
+                # packing each field on its own, since each field's
+                # type may accept values which 'struct' on its own
+                # would not, such as iterables of values.
+                pack_body += [
+                    "",
+                    "try:",
+                    f"    packed_{first_index} = run_struct_{first_index}.pack({''.join(f'self.{field}, ' for _, field, _ in run)})",
+                    "except struct_error:",
+                    f"    packed_{first_index} = b''.join(({''.join(f'field_type_{i}.pack(self.{field}, ctx=type_ctx), ' for i, field, _ in run)}))",
+                ]
+
+                packed_fields.append(f"packed_{first_index}")
+
+                continue
+
+            for i, field, field_type in run:
+                namespace[f"field_type_{i}"] = field_type
+
+                unpack_body += [
+                    "",
+                    f"value = field_type_{i}.unpack(buf, ctx=type_ctx)",
+                ]
+                unpack_body += cls._field_assignment(field, "value")
+
+                packed_fields.append(f"field_type_{i}.pack(self.{field}, ctx=type_ctx)")
+
+        unpack_body.append("return self")
+
+        pack_body += [
+            "",
+            f"return b''.join(({''.join(f'{packed}, ' for packed in packed_fields)}))",
+        ]
+
+        cls._unpack_fields = classmethod(util.generate_function(
+            "_unpack_fields", "cls, buf, ctx",
+
+            unpack_body,
+
+            namespace = namespace,
+            qualname  = f"{cls.__qualname__}._unpack_fields",
+            module    = cls.__module__,
+        ))
+
+        cls._pack_fields = util.generate_function(
+            "_pack_fields", "self, ctx",
+
+            pack_body,
+
+            namespace = namespace,
+            qualname  = f"{cls.__qualname__}._pack_fields",
+            module    = cls.__module__,
+        )
+
+    @classmethod
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls._init_id()
+        cls._init_fields_from_annotations()
+        cls._init_static_header()
+
+        cls._generate_init_method()
+        cls._generate_comparison_methods()
+        cls._generate_size_method()
+        cls._generate_marshal_methods()
+
+    def __init__(self, /, *, ctx=None, **fields):
+        self._initialize_fields(ctx, fields)
 
     def header(self, *, ctx=None):
         """Gets the :class:`Packet.Header` for the :class:`Packet`.
@@ -616,7 +1005,7 @@ class Packet:
         # its own context, then it would use the incorrect class to
         # potentially default construct the context.
         if ctx is None:
-            ctx = self.Context()
+            ctx = self._default_ctx()
 
         return self.Header(self, ctx=ctx)
 
@@ -661,24 +1050,7 @@ class Packet:
         MyPacket(hello=bytearray(b'Hello'), world=bytearray(b'World'))
         """
 
-        self = object.__new__(cls)
-
-        buf = util.file_object(buf)
-
-        type_ctx = self.type_ctx(ctx)
-        for attr, attr_type in cls.enumerate_field_types():
-            value = attr_type.unpack(buf, ctx=type_ctx)
-
-            try:
-                setattr(self, attr, value)
-
-            except AttributeError:
-                # If trying to set an unpacked value fails
-                # (like if the attribute is read-only)
-                # then just move on.
-                pass
-
-        return self
+        return cls._unpack_fields(buf, ctx)
 
     @classmethod
     async def unpack_async(cls, reader, *, ctx=None):
@@ -766,12 +1138,7 @@ class Packet:
         b'\x04\x00\x01\x02\x03'
         """
 
-        type_ctx = self.type_ctx(ctx)
-
-        return b"".join(
-            attr_type.pack(value, ctx=type_ctx)
-            for attr_type, value in self.field_types_and_values()
-        )
+        return self._pack_fields(ctx)
 
     def pack(self, *, ctx=None):
         r"""Packs a :class:`Packet` to raw data.
@@ -807,10 +1174,25 @@ class Packet:
         b'\xff\x04\x00\x01\x02\x03'
         """
 
-        packed_header = self.header(ctx=ctx).pack(ctx=ctx)
+        # Resolve the default context once so that it
+        # isn't looked up again for both the header
+        # and the rest of the packet.
+        if ctx is None:
+            ctx = self._default_ctx()
+
+        if self._has_static_header:
+            packed_header = self._packed_static_header(ctx=ctx)
+        else:
+            packed_header = self.header(ctx=ctx).pack(ctx=ctx)
 
         return packed_header + self.pack_without_header(ctx=ctx)
 
+    @classmethod
+    @util.cache
+    def _packed_static_header(cls, *, ctx):
+        # NOTE: The header only needs our class to get our static ID.
+        return cls.Header(cls, ctx=ctx).pack(ctx=ctx)
+
     def make_immutable(self):
         """Makes the :class:`Packet` immutable.
 
@@ -861,7 +1243,7 @@ class Packet:
         self._immutable_flag = True
 
     def __setattr__(self, attr, value):
-        if hasattr(self, "_immutable_flag"):
+        if self._immutable_flag:
             raise AttributeError(f"This '{type(self).__qualname__}' instance has been made immutable")
 
         super().__setattr__(attr, value)
@@ -917,21 +1299,92 @@ class Packet:
 
         # TODO: Use 'copy.replace' when Python 3.12 support is dropped?
 
-        copied = copy.deepcopy(self)
+        if self._uses_default_deepcopy():
+            copied = self._deepcopy_attributes()
 
-        try:
-            # Try to remove the mutable flag.
-            del copied._immutable_flag
+        else:
+            copied = copy.deepcopy(self)
+
+            try:
+                # Try to remove the mutable flag.
+                del copied._immutable_flag
 
-        except AttributeError:
-            # If that fails, we were already mutable.
-            pass
+            except AttributeError:
+                # If that fails, we were already mutable.
+                pass
 
         for name, value in new_attrs.items():
             setattr(copied, name, value)
 
         return copied
 
+    @classmethod
+    @util.cache
+    def _uses_default_deepcopy(cls):
+        # Whether 'copy.deepcopy' would copy us by
+        # just deep copying our attributes.
+
+        if getattr(cls, "__deepcopy__", None) is not None:
+            return False
+
+        return all(
+            getattr(cls, method, None) is getattr(object, method, None)
+
+            for method in ("__reduce_ex__", "__reduce__", "__getstate__", "__setstate__")
+        )
+
+    @classmethod
+    @util.cache
+    def _slot_descriptors(cls):
+        # The descriptors for the slot attributes of
+        # subclasses which define '__slots__'.
+
+        return tuple(
+            descriptor
+
+            for base in cls.__mro__
+            for descriptor in vars(base).values()
+
+            if isinstance(descriptor, types.MemberDescriptorType)
+        )
+
+    def _deepcopy_attributes(self):
+        # Does the same as 'copy.deepcopy' would, except
+        # leaving out the immutable flag, but without the
+        # generic machinery of '__reduce_ex__', and skipping
+        # the copying of values which are immutable anyways.
+
+        copied = object.__new__(type(self))
+
+        # Record ourselves in the memo so that attributes
+        # which refer back to us refer to the copy instead.
+        memo = {id(self): copied}
+
+        copied_attrs = copied.__dict__
+        for attr, value in self.__dict__.items():
+            if attr == "_immutable_flag":
+                continue
+
+            if type(value) not in _atomic_types:
+                value = copy.deepcopy(value, memo)
+
+            copied_attrs[attr] = value
+
+        for descriptor in self._slot_descriptors():
+            try:
+                value = descriptor.__get__(self)
+
+            except AttributeError:
+                # The slot attribute was never set.
+                continue
+
+            if type(value) not in _atomic_types:
+                value = copy.deepcopy(value, memo)
+
+            descriptor.__set__(copied, value)
+
+        return copied
+
     def immutable_copy(self, **new_attrs):
         """Makes an immutable copy of the :class:`Packet`.
 
@@ -996,6 +1449,14 @@ class Packet:
 
         return copied
 
+    @classmethod
+    @util.cache
+    def _default_ctx(cls):
+        # Since a 'Packet.Context' must be immutable, we
+        # can reuse the same default constructed context
+        # instead of constructing a new one every time.
+        return cls.Context()
+
     def type_ctx(self, ctx):
         """Converts a :class:`Packet.Context` to a :class:`.Type.Context`.
 
@@ -1011,7 +1472,7 @@ class Packet:
         """
 
         if ctx is None:
-            ctx = self.Context()
+            ctx = self._default_ctx()
 
         return Type.Context(self, ctx=ctx)
 
@@ -1260,7 +1721,15 @@ class Packet:
         """
 
         if ctx is None:
-            ctx = cls.Context()
+            ctx = cls._default_ctx()
+
+        return cls._static_size(ctx=ctx)
+
+    @classmethod
+    @util.cache
+    def _static_size(cls, *, ctx):
+        # The static size of a 'Packet' can't change
+        # for the same context, so we only calculate it once.
 
         type_ctx = Type.Context(ctx=ctx)
 
@@ -1270,13 +1739,7 @@ class Packet:
         # NOTE: We have this separate function so that
         # we can get the size of a 'Packet.Header' instance.
 
-        type_ctx = self.type_ctx(ctx)
-
-        return sum(
-            attr_type.size(attr_value, ctx=type_ctx)
-
-            for attr_type, attr_value in self.field_types_and_values()
-        )
+        return self._fields_size(ctx)
 
     @size.instance_method
     def size(self, *, ctx=None):
@@ -1315,7 +1778,6 @@ class Packet:
         return util.subclasses(cls)
 
     @classmethod
-    @util.cache
     def subclass_with_id(cls, id, /, *, ctx=None):
         """Gets the subclass with the equivalent ID.
 
@@ -1337,14 +1799,24 @@ class Packet:
         """
 
         if ctx is None:
-            ctx = cls.Context()
+            ctx = cls._default_ctx()
+
+        return cls._subclasses_by_id(ctx=ctx).get(id)
 
+    @classmethod
+    @util.cache
+    def _subclasses_by_id(cls, *, ctx):
+        # Map each ID to its subclass all at once so that
+        # looking up a subclass doesn't need to go through
+        # every subclass each time a new ID is looked up.
+
+        subclasses_by_id = {}
         for subclass in cls.subclasses():
             subclass_id = subclass.id(ctx=ctx)
-            if subclass_id is not None and subclass_id == id:
-                return subclass
+            if subclass_id is not None:
+                subclasses_by_id.setdefault(subclass_id, subclass)
 
-        return None
+        return subclasses_by_id
 
     def __eq__(self, other):
         # ID and header are not included in equality.
@@ -1352,14 +1824,10 @@ class Packet:
         if not isinstance(other, Packet):
             return NotImplemented
 
-        if self._fields != other._fields:
+        if self._fields is not other._fields and self._fields != other._fields:
             return False
 
-        return all(
-            value == other_value
-            for value, other_value in
-            zip(self.field_values(), other.field_values())
-        )
+        return self._fields_equal(other)
 
     # NOTE: We do not implement '__hash__' since Packets are not immutable by default.
     # Technically mutability is contextual and not a fact of a type.
@@ -1369,20 +1837,7 @@ class Packet:
     __hash__ = None
 
     def __repr__(self):
-        return (
-            f"{type(self).__qualname__}("
-
-            +
-
-            ", ".join(
-                f'{attr}={repr(value)}'
-                for attr, value in self.enumerate_field_values()
-            )
-
-            +
-
-            ")"
-        )
+        return f"{type(self).__qualname__}({self._fields_repr()})"
 
 # Will be set to 'Packet.Header'.
 class _Header(Packet):
@@ -1451,13 +1906,40 @@ class _Header(Packet):
         If ``packet`` is not ``None`` and any ``**fields`` are passed.
     """
 
-    @staticmethod
-    def _get_field(packet, name, *, ctx):
-        field = getattr(packet, name)
-        if inspect.ismethod(field):
-            field = field(ctx=ctx)
+    @classmethod
+    def _generate_fields_from_packet_method(cls):
+        # Like with the other generated functions of 'Packet',
+        # we generate a function to get the values of our fields
+        # from a body packet which is specialized to those fields.
+        #
+        # If the attribute of the packet is a method, such as
+        # for a 'Packet.id' classmethod, then it is called
+        # with the context to get the value of the field.
+
+        namespace = dict(
+            MethodType = types.MethodType,
+        )
+
+        body = []
+        for i, field in enumerate(cls.field_names()):
+            body += [
+                f"field_{i} = packet.{field}",
+                f"if isinstance(field_{i}, MethodType):",
+                f"    field_{i} = field_{i}(ctx=ctx)",
+                "",
+            ]
+
+        body.append(f"return {{{''.join(f'{field!r}: field_{i}, ' for i, field in enumerate(cls.field_names()))}}}")
+
+        cls._fields_from_packet = util.generate_function(
+            "_fields_from_packet", "self, packet, ctx",
 
-        return field
+            body,
+
+            namespace = namespace,
+            qualname  = f"{cls.__qualname__}._fields_from_packet",
+            module    = cls.__module__,
+        )
 
     @classmethod
     def __init_subclass__(cls, **kwargs):
@@ -1474,16 +1956,14 @@ class _Header(Packet):
         if cls.Context is not Packet.Context:
             raise TypeError(f"'{cls.__qualname__}' may have no context of its own")
 
+        cls._generate_fields_from_packet_method()
+
     def __init__(self, packet=None, /, *, ctx=None, **fields):
         if packet is not None:
             if len(fields) != 0:
                 raise TypeError("'Packet.Header' cannot be passed both a 'Packet' and normal fields")
 
-            fields = {
-                name: self._get_field(packet, name, ctx=ctx)
-
-                for name in self.field_names()
-            }
+            fields = self._fields_from_packet(packet, ctx)
 
         super().__init__(ctx=ctx, **fields)
 
@@ -1502,6 +1982,15 @@ Packet.Header        = _Header
 # Remove access through '_Header' to stop it from showing in docs.
 del _Header
 
+# Generate the field functions for 'Packet' itself
+# since '__init_subclass__' is only called for its subclasses.
+Packet._generate_init_method()
+Packet._generate_comparison_methods()
+Packet._generate_size_method()
+Packet._generate_marshal_methods()
+
+Packet.Header._generate_fields_from_packet_method()
+
 class GenericPacket(Packet):
     """A generic collection of data.
 
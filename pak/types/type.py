@@ -89,8 +89,10 @@ class Type:
         """
 
         def __init__(self, packet=None, *, ctx=None):
-            self.packet     = packet
-            self.packet_ctx = ctx
+            # NOTE: We bypass our '__setattr__' since
+            # it always raises, as we are immutable.
+            object.__setattr__(self, "packet",     packet)
+            object.__setattr__(self, "packet_ctx", ctx)
 
         def __getattr__(self, attr):
             if attr in ("packet", "packet_ctx"):
@@ -110,10 +112,7 @@ class Type:
             return native_attrs + [attr for attr in dir(self.packet_ctx) if attr not in native_attrs]
 
         def __setattr__(self, attr, value):
-            if hasattr(self, "packet_ctx"):
-                raise TypeError(f"'{type(self).__qualname__}' is immutable")
-
-            super().__setattr__(attr, value)
+            raise TypeError(f"'{type(self).__qualname__}' is immutable")
 
         def __hash__(self):
             # We hash the identity of our packet because conceptually
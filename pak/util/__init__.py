@@ -1,5 +1,6 @@
 from .aio        import *
 from .bits       import *
+from .codegen    import *
 from .decorators import *
 from .exceptions import *
 from .inspection import *
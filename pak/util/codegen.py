@@ -0,0 +1,88 @@
+"""Utilities for generating code at runtime."""
+
+__all__ = [
+    "generate_function",
+]
+
+def generate_function(name, parameters, body, *, namespace=None, qualname=None, module=None):
+    """Generates a function from its source code.
+
+    This is useful for specializing functions to data which
+    is only known at runtime but which does not change
+    afterwards, such as the fields of a class, so that
+    the overhead of e.g. looping over those fields at
+    every call may be avoided.
+
+    Parameters
+    ----------
+    name : :class:`str`
+        The name of the function.
+    parameters : :class:`str`
+        The source code of the parameters of the function.
+    body : iterable of :class:`str`
+        The lines of source code of the body of the function.
+
+        The lines should not be indented relative to the function.
+    namespace : :class:`dict` or ``None``
+        The global namespace for the function.
+
+        If ``None``, then an empty namespace is used.
+    qualname : :class:`str` or ``None``
+        The qualified name of the function.
+
+        If ``None``, then ``name`` is used.
+    module : :class:`str` or ``None``
+        The name of the module the function should report
+        being defined in, i.e. its ``__module__`` attribute.
+
+        If ``None``, then the ``__module__`` attribute
+        of the function will be ``None``.
+
+    Returns
+    -------
+    :class:`function`
+        The generated function.
+
+    Examples
+    --------
+    >>> import pak
+    >>> add = pak.util.generate_function(
+    ...     "add", "x, y",
+    ...
+    ...     ["return x + y"],
+    ... )
+    >>> add(1, 2)
+    3
+    >>> scale = pak.util.generate_function(
+    ...     "scale", "x",
+    ...
+    ...     ["return x * factor"],
+    ...
+    ...     namespace = dict(factor=2),
+    ... )
+    >>> scale(3)
+    6
+    >>> negate = pak.util.generate_function(
+    ...     "negate", "x",
+    ...
+    ...     ["return -x"],
+    ...
+    ...     qualname = "Number.negate",
+    ...     module   = "numbers_module",
+    ... )
+    >>> negate.__qualname__, negate.__module__
+    ('Number.negate', 'numbers_module')
+    """
+
+    source = f"def {name}({parameters}):\n" + "".join(f"    {line}\n" for line in body)
+
+    namespace = {} if namespace is None else dict(namespace)
+    exec(compile(source, f"<generated {qualname or name}>", "exec"), namespace)
+
+    function = namespace[name]
+    if qualname is not None:
+        function.__qualname__ = qualname
+
+    function.__module__ = module
+
+    return function
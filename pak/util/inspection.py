@@ -26,12 +26,21 @@ def subclasses(parent_class):
 
     subclasses = set()
 
+    # NOTE: The order we visit classes in doesn't matter since
+    # we return a set, so we pop from the end of the list, which
+    # is cheaper than popping from the front.
     while len(remaining_classes) != 0:
-        parent_class = remaining_classes.pop(0)
+        parent_class = remaining_classes.pop()
 
-        direct_subclasses = parent_class.__subclasses__()
-        subclasses.update(direct_subclasses)
-        remaining_classes.extend(direct_subclasses)
+        for subclass in parent_class.__subclasses__():
+            # A class with several bases in the hierarchy is a
+            # direct subclass of each of them, and we only
+            # need to visit its own subclasses once.
+            if subclass in subclasses:
+                continue
+
+            subclasses.add(subclass)
+            remaining_classes.append(subclass)
 
     return frozenset(subclasses)
 
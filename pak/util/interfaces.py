@@ -37,7 +37,7 @@ def file_object(obj):
 
     Parameters
     ----------
-    obj : file object or :class:`bytes` or :class:`bytearray`
+    obj : file object or :class:`bytes` or :class:`bytearray` or :class:`memoryview`
         The object to convert.
 
     Returns
@@ -46,7 +46,7 @@ def file_object(obj):
         The corresponding file object.
     """
 
-    if isinstance(obj, (bytes, bytearray)):
+    if isinstance(obj, (bytes, bytearray, memoryview)):
         return io.BytesIO(obj)
 
     return obj
@@ -31,6 +31,66 @@ def test_bit_field_attributes():
     assert obj.first  is False
     assert obj.second == 0
 
+def test_bit_field_slots():
+    class TestSlots(pak.BitField, slots=True):
+        first:  1
+        second: 2
+
+    obj = TestSlots(second=2)
+
+    assert not hasattr(obj, "__dict__")
+
+    assert obj.first  is False
+    assert obj.second == 2
+
+    assert obj.pack_to_int() == 0b100
+    assert TestSlots.unpack_from_int(0b100) == obj
+
+    with pytest.raises(AttributeError):
+        obj.third = 0
+
+    with pytest.raises(TypeError, match="slots=True"):
+        class ManualSlots(pak.BitField):
+            __slots__ = ()
+
+            first: 1
+
+def test_bit_field_custom_setattr():
+    class TestSetattr(pak.BitField):
+        first: 2
+
+        def __setattr__(self, attr, value):
+            if attr == "first" and value > 3:
+                raise ValueError("Too large")
+
+            super().__setattr__(attr, value)
+
+    assert TestSetattr(first=3).first == 3
+
+    with pytest.raises(ValueError, match="Too large"):
+        TestSetattr(first=9)
+
+    class TestProperty(pak.BitField):
+        first: 2
+
+        @property
+        def first(self):
+            return self._first
+
+        @first.setter
+        def first(self, value):
+            self._first = int(value)
+
+    assert TestProperty(first=1.5).first == 1
+    assert TestProperty().first          == 0
+
+def test_bit_field_generated_module():
+    class TestModule(pak.BitField):
+        first: 1
+
+    assert TestModule.pack_to_int.__module__             == __name__
+    assert TestModule.unpack_from_int.__func__.__module__ == __name__
+
 def test_bit_field_equality():
     class TestEquality(pak.BitField):
         first:  1
@@ -46,6 +106,27 @@ def test_bit_field_equality():
     assert TestEquality() != OtherBitField()
     assert TestEquality() != 0
 
+def test_bit_field_overridden_marshal():
+    class TestOverridden(pak.BitField):
+        first:  1
+        second: 2
+
+        @classmethod
+        def unpack_from_int(cls, value):
+            return super().unpack_from_int(value ^ 0b111)
+
+        def pack_to_int(self):
+            return super().pack_to_int() ^ 0b111
+
+    assert TestOverridden.unpack_from_int(0b000) == TestOverridden(first=True,  second=3)
+    assert TestOverridden.unpack_from_int(0b101) == TestOverridden(first=False, second=1)
+
+    assert TestOverridden(first=True,  second=3).pack_to_int() == 0b000
+    assert TestOverridden(first=False, second=1).pack_to_int() == 0b101
+
+    with pytest.raises(ValueError, match="too wide for width"):
+        TestOverridden(second=4).pack_to_int()
+
 class ReprTestBitField(pak.BitField):
         first:  1
         second: 2
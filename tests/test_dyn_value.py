@@ -1,3 +1,5 @@
+import collections.abc
+import gc
 import pytest
 from pak import *
 
@@ -70,3 +72,100 @@ def test_explciit_disable():
 def test_not_implemented_get():
     with pytest.raises(NotImplementedError):
         DynamicValue.get(object())
+
+def test_dynamic_value_instance_check():
+    class MappingDynamicValue(DynamicValue):
+        _type = collections.abc.Mapping
+
+        def __init__(self, mapping):
+            self.mapping = mapping
+
+        def get(self, *, ctx=None):
+            return len(self.mapping)
+
+    class TupleDynamicValue(DynamicValue):
+        _type = (bytes, bytearray)
+
+        def __init__(self, data):
+            self.data = data
+
+        def get(self, *, ctx=None):
+            return len(self.data)
+
+    try:
+        assert DynamicValue({1: 2}).get() == 1
+
+        assert DynamicValue(b"abc").get()            == 3
+        assert DynamicValue(bytearray(b"ab")).get() == 2
+
+    finally:
+        MappingDynamicValue.disable()
+        TupleDynamicValue.disable()
+
+    assert DynamicValue({1: 2}) == {1: 2}
+    assert DynamicValue(b"abc") == b"abc"
+
+def test_dynamic_value_same_type():
+    class FirstDynamicValue(DynamicValue):
+        _type = float
+
+        def __init__(self, value):
+            self.value = value
+
+        def get(self, *, ctx=None):
+            return 1
+
+    class SecondDynamicValue(FirstDynamicValue):
+        def get(self, *, ctx=None):
+            return 2
+
+    # The most recently enabled subclass is used.
+    assert DynamicValue(0.0).get() == 2
+
+    # Disabling a class which is not in use changes nothing.
+    FirstDynamicValue.disable()
+    FirstDynamicValue.disable()
+    assert DynamicValue(0.0).get() == 2
+
+    FirstDynamicValue.enable()
+    assert DynamicValue(0.0).get() == 1
+
+    # Other enabled subclasses are fallen back on.
+    FirstDynamicValue.disable()
+    assert DynamicValue(0.0).get() == 2
+
+    SecondDynamicValue.disable()
+    assert DynamicValue(0.0) == 0.0
+
+def test_dynamic_value_collected_subclass():
+    class LocalDynamicValue(DynamicValue):
+        _type = complex
+
+        def __init__(self, value):
+            self.value = value
+
+        def get(self, *, ctx=None):
+            return self.value.real
+
+    assert DynamicValue(1j).get() == 0
+
+    del LocalDynamicValue
+    gc.collect()
+
+    assert DynamicValue(1j) == 1j
+
+def test_dynamic_value_resolved_subclasses_bounded():
+    # Keep collected subclasses from clearing the cache while we fill it.
+    gc.collect()
+    gc.disable()
+
+    try:
+        for i in range(DynamicValue._max_resolved_subclasses + 1):
+            value_type = type(f"Type{i}", (), {})
+
+            assert isinstance(DynamicValue(value_type()), value_type)
+
+        assert len(DynamicValue._resolved_subclasses) <= DynamicValue._max_resolved_subclasses
+
+    finally:
+        gc.enable()
@@ -28,7 +28,7 @@ class DummyValuePacket(DummyPacket):
     value: pak.UInt8
 
 class DummyConnection(pak.io.Connection):
-    def __init__(self, *, data=None, ctx=DummyPacket.Context()):
+    def __init__(self, *, data=None, ctx=DummyPacket.Context(), buffer_size=None):
         reader = None
         writer = None
 
@@ -36,7 +36,7 @@ class DummyConnection(pak.io.Connection):
             reader = pak.io.ByteStreamReader(data)
             writer = pak.io.ByteStreamWriter()
 
-        super().__init__(reader=reader, writer=writer, ctx=ctx)
+        super().__init__(reader=reader, writer=writer, ctx=ctx, buffer_size=buffer_size)
 
     async def _read_next_packet(self):
         header_data = await self.read_data(DummyPacket.Header.size(ctx=self.ctx))
@@ -191,10 +191,28 @@ def test_connection_create_packet_positional_only():
 async def test_connection_read_data():
     connection = DummyConnection(data=b"abcd")
 
+    assert await connection.read_data(0) == b""
     assert await connection.read_data(3) == b"abc"
 
     assert await connection.read_data(2) is None
 
+    assert connection.reader.at_eof()
+
+    assert await connection.read_data(0) == b""
+    assert await connection.read_data(1) is None
+
+    with pytest.raises(ValueError, match="negative"):
+        await connection.read_data(-1)
+
+async def test_connection_buffer_size():
+    connection = DummyConnection(data=b"abcd", buffer_size=2)
+
+    assert isinstance(connection.reader, pak.io.BufferedReader)
+    assert connection.reader.capacity == 2
+
+    assert await connection.read_data(3) == b"abc"
+    assert await connection.read_data(2) is None
+
 async def test_connection_continuously_read_packets():
     connection = DummyConnection(
         # A single DummyValuePacket(value=2).
@@ -301,6 +319,66 @@ async def test_connection_write_data():
 
     assert connection.writer.written_data == b"abcd"
 
+class DrainCountingWriter(pak.io.ByteStreamWriter):
+    def __init__(self):
+        super().__init__()
+
+        self.num_drains = 0
+
+    async def drain(self):
+        self.num_drains += 1
+
+        await super().drain()
+
+async def test_connection_write_data_no_drain():
+    connection = DummyConnection(data=b"")
+    connection.writer = DrainCountingWriter()
+
+    await connection.write_data(b"ab", drain=False)
+    assert connection.writer.num_drains == 0
+
+    await connection.write_data(b"cd")
+    assert connection.writer.num_drains == 1
+
+    assert connection.writer.written_data == b"abcd"
+
+async def test_connection_write_packets():
+    connection = DummyConnection(data=b"")
+    connection.writer = DrainCountingWriter()
+
+    await connection.write_packets([
+        DummyValuePacket(value=1),
+        DummyValuePacket(value=2),
+    ])
+
+    assert connection.writer.num_drains  == 1
+    assert connection.writer.written_data == b"\x00\x01\x01\x00\x01\x02"
+
+    # Draining is no longer deferred afterwards.
+    await connection.write_data(b"")
+    assert connection.writer.num_drains == 2
+
+async def test_connection_write_packets_concurrent():
+    class YieldingConnection(DummyConnection):
+        async def write_packet_instance(self, packet):
+            await pak.util.yield_exec()
+
+            await super().write_packet_instance(packet)
+
+    connection = YieldingConnection(data=b"")
+    connection.writer = DrainCountingWriter()
+
+    write_packets_task = asyncio.create_task(connection.write_packets([
+        DummyValuePacket(value=1),
+    ]))
+    await pak.util.yield_exec()
+
+    # Other tasks still drain while 'write_packets' is ongoing.
+    await connection.write_data(b"zz")
+    await write_packets_task
+
+    assert connection.writer.num_drains == 2
+
 async def test_connection_write_packet_instance():
     # This is technically testing our test code,
     # however it is added so that we can ensure
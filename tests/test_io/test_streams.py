@@ -13,6 +13,23 @@ async def test_byte_stream_reader_read():
     assert reader.at_eof()
     assert await reader.read() == b""
 
+async def test_byte_stream_reader_copy():
+    data   = bytearray(b"abcd")
+    reader = pak.io.ByteStreamReader(data)
+
+    assert await reader.read(1) == b"a"
+    assert data == b"abcd"
+
+    reader = pak.io.ByteStreamReader(data, copy=False)
+
+    assert await reader.read(1) == b"a"
+    assert data == b"bcd"
+
+    # Non-'bytearray' data is always copied.
+    reader = pak.io.ByteStreamReader(b"abcd", copy=False)
+
+    assert await reader.read() == b"abcd"
+
 async def test_byte_stream_reader_readline():
     reader = pak.io.ByteStreamReader(b"abcd\nefgh")
 
@@ -69,6 +86,86 @@ async def test_byte_stream_reader_readuntil_multiple():
 
     assert reader.at_eof()
 
+class CountingReader(pak.io.ByteStreamReader):
+    def __init__(self, data):
+        super().__init__(data)
+
+        self.num_reads = 0
+
+    async def read(self, n=-1):
+        self.num_reads += 1
+
+        return await super().read(n)
+
+async def test_buffered_reader_read():
+    underlying = CountingReader(b"abcdefgh")
+    reader     = pak.io.BufferedReader(underlying, capacity=4)
+
+    assert not reader.at_eof()
+
+    assert await reader.read(0) == b""
+    assert await reader.read(1) == b"a"
+    assert await reader.read(1) == b"b"
+    assert await reader.read(4) == b"cd"
+    assert underlying.num_reads == 1
+
+    # Large reads bypass the buffer.
+    assert await reader.read(4) == b"efgh"
+    assert underlying.num_reads == 2
+
+    assert reader.at_eof()
+    assert await reader.read() == b""
+
+    reader = pak.io.BufferedReader(pak.io.ByteStreamReader(b"abcd"), capacity=2)
+
+    assert await reader.read(1) == b"a"
+    assert await reader.read()  == b"bcd"
+
+async def test_buffered_reader_readline():
+    reader = pak.io.BufferedReader(pak.io.ByteStreamReader(b"abcd\nefgh"), capacity=2)
+
+    assert await reader.readline() == b"abcd\n"
+    assert await reader.readline() == b"efgh"
+
+    assert reader.at_eof()
+
+    assert await reader.readline() == b""
+
+async def test_buffered_reader_readexactly():
+    underlying = CountingReader(b"abcdefgh")
+    reader     = pak.io.BufferedReader(underlying, capacity=4)
+
+    assert await reader.readexactly(1) == b"a"
+    assert await reader.readexactly(2) == b"bc"
+    assert underlying.num_reads == 1
+
+    assert await reader.readexactly(3) == b"def"
+
+    with pytest.raises(asyncio.IncompleteReadError) as exc_info:
+        await reader.readexactly(4)
+
+    assert exc_info.value.partial  == b"gh"
+    assert exc_info.value.expected == 4
+
+    assert reader.at_eof()
+    assert await reader.readexactly(0) == b""
+
+async def test_buffered_reader_readuntil():
+    reader = pak.io.BufferedReader(pak.io.ByteStreamReader(b"abcdef"), capacity=2)
+
+    assert await reader.readuntil((b"cd", b"de")) == b"abcd"
+
+    with pytest.raises(ValueError, match="Separator.*one byte"):
+        await reader.readuntil(b"")
+
+    with pytest.raises(asyncio.IncompleteReadError) as exc_info:
+        await reader.readuntil(b"g")
+
+    assert exc_info.value.partial  == b"ef"
+    assert exc_info.value.expected is None
+
+    assert reader.at_eof()
+
 async def test_byte_stream_writer_close():
     writer = pak.io.ByteStreamWriter()
 
@@ -102,6 +199,36 @@ async def test_byte_stream_writer_close():
 
     await set_closed_task
 
+async def test_byte_stream_writer_close_cancelled_wait():
+    writer = pak.io.ByteStreamWriter()
+
+    cancelled_task = asyncio.create_task(writer.wait_closed())
+    await pak.util.yield_exec()
+
+    cancelled_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled_task
+
+    wait_task = asyncio.create_task(writer.wait_closed())
+    await pak.util.yield_exec()
+
+    writer.close()
+    await wait_task
+
+async def test_byte_stream_writer_close_multiple_waits():
+    writer = pak.io.ByteStreamWriter()
+
+    cancelled_task = asyncio.create_task(writer.wait_closed())
+    wait_task      = asyncio.create_task(writer.wait_closed())
+    await pak.util.yield_exec()
+
+    cancelled_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled_task
+
+    writer.close()
+    await wait_task
+
 async def test_byte_stream_writer_write():
     writer = pak.io.ByteStreamWriter()
 
@@ -123,11 +250,12 @@ async def test_byte_stream_writer_writelines():
 
     writer.writelines([
         b"abcd",
-        b"efgh",
+        bytearray(b"efgh"),
+        memoryview(b"ijkl"),
     ])
     await writer.drain()
 
-    assert writer.written_data == b"abcdefgh"
+    assert writer.written_data == b"abcdefghijkl"
 
     writer.close()
     await writer.wait_closed()
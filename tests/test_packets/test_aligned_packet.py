@@ -1,4 +1,6 @@
 import asyncio
+import struct
+
 import pak
 import pytest
 
@@ -58,3 +60,227 @@ async def test_aligned_packet_read_only():
 
     assert TestReadOnly.unpack(b"\x00").field == 1
     assert (await TestReadOnly.unpack_async(b"\x00")).field == 1
+
+def test_aligned_packet_overridden_marshal():
+    class Parent(pak.AlignedPacket):
+        first: pak.Int8
+
+        @classmethod
+        def unpack(cls, buf, *, ctx=None):
+            packet = super().unpack(buf, ctx=ctx)
+            packet.first += 1
+
+            return packet
+
+    class Child(Parent):
+        second: pak.Int16
+
+    assert Child.unpack(b"\x01\xAA\x02\x00") == Child(first=2, second=2)
+    assert Child(first=1, second=2).pack()   == b"\x01\x00\x02\x00"
+
+class AlignedStructTest(pak.AlignedPacket):
+    first:  pak.Int16
+    second: pak.Float32
+    third:  pak.Bool
+
+test_aligned_packet_struct_marshal = pak.test.packet_behavior_func_both(
+    (
+        AlignedStructTest(first=1, second=2.0, third=True),
+
+        b"\x01\x00\x00\x00" + b"\x00\x00\x00\x40" + b"\x01\x00\x00\x00"
+    ),
+)
+
+def test_aligned_packet_struct_not_enough_padding():
+    assert AlignedStructTest._fields_struct(list(AlignedStructTest.enumerate_field_types())) is not None
+
+    with pytest.raises(pak.util.BufferOutOfDataError, match="padding"):
+        AlignedStructTest.unpack(b"\x01\x00\xAA\xAA\x00\x00\x00\x40\x01\xBB\xBB")
+
+class CustomUnpackInt8(pak.Int8):
+    @classmethod
+    def _unpack(cls, buf, *, ctx):
+        return super()._unpack(buf, ctx=ctx) + 1
+
+class CustomPackInt8(pak.Int8):
+    @classmethod
+    def _pack(cls, value, *, ctx):
+        return super()._pack(value - 1, ctx=ctx)
+
+class DynamicAlignmentInt8(pak.Int8):
+    @classmethod
+    def _alignment(cls, *, ctx):
+        return 1
+
+class PairInt8(pak.StructType):
+    fmt        = "bb"
+    _alignment = 1
+
+@pytest.mark.parametrize("field_types", [
+    [pak.StructType],
+    [pak.EmptyType, pak.Int8],
+    [CustomUnpackInt8],
+    [CustomPackInt8],
+    [DynamicAlignmentInt8],
+    [PairInt8],
+    [pak.Int8, pak.Int16.big_endian()],
+    [pak.Int8.make_type("NativeInt8", endian="@")],
+])
+def test_aligned_packet_no_fields_struct(field_types):
+    assert pak.AlignedPacket._fields_struct([(f"field_{i}", field_type) for i, field_type in enumerate(field_types)]) is None
+
+def test_aligned_packet_struct_fallback():
+    class TestFallback(pak.AlignedPacket):
+        first:  CustomUnpackInt8
+        second: pak.Int16.big_endian()
+
+    assert TestFallback.unpack(b"\x01\xAA\x00\x02") == TestFallback(first=2, second=2)
+    assert TestFallback(first=1, second=2).pack()   == b"\x01\x00\x00\x02"
+
+def test_aligned_packet_dynamic_padding():
+    class TestDynamic(pak.AlignedPacket):
+        first:  DynamicAlignmentInt8
+        second: pak.Int16
+
+    assert TestDynamic._static_padding_lengths(list(TestDynamic.field_types())) is None
+
+    assert TestDynamic.unpack(b"\x01\xAA\x02\x00") == TestDynamic(first=1, second=2)
+    assert TestDynamic(first=1, second=2).pack()   == b"\x01\x00\x02\x00"
+
+    with pytest.raises(pak.util.BufferOutOfDataError, match="padding"):
+        TestDynamic.unpack(b"\x01")
+
+def test_aligned_packet_custom_alignment():
+    class TestCustomAlignment(pak.AlignedPacket):
+        field: pak.Int8
+
+        @classmethod
+        def alignment(cls, *, ctx=None):
+            return 4
+
+    assert TestCustomAlignment._static_padding_lengths(list(TestCustomAlignment.field_types())) is None
+
+    assert TestCustomAlignment.unpack(b"\x01\xAA\xAA\xAA") == TestCustomAlignment(field=1)
+    assert TestCustomAlignment(field=1).pack()             == b"\x01\x00\x00\x00"
+    assert TestCustomAlignment.size()                      == 4
+
+class AlignedOptimizeTest(pak.AlignedPacket, align_optimize=True):
+    first:    pak.Int16
+    second:   pak.Int32
+    disabled: pak.EmptyType
+    third:    pak.Int8
+
+test_aligned_packet_align_optimize_marshal = pak.test.packet_behavior_func_both(
+    (
+        AlignedOptimizeTest(first=1, second=2, third=3),
+
+        b"\x02\x00\x00\x00\x01\x00\x03\x00"
+    ),
+)
+
+def test_aligned_packet_align_optimize():
+    class TestInherited(AlignedOptimizeTest):
+        fourth: pak.Int8
+
+    class TestDisabled(AlignedOptimizeTest, align_optimize=False):
+        pass
+
+    assert AlignedOptimizeTest.size() == 8
+    assert list(AlignedOptimizeTest.enumerate_field_types()) == [
+        ("first",    pak.Int16),
+        ("second",   pak.Int32),
+        ("disabled", pak.EmptyType),
+        ("third",    pak.Int8),
+    ]
+
+    assert TestInherited(first=1, second=2, third=3, fourth=4).pack() == b"\x02\x00\x00\x00\x01\x00\x03\x04"
+
+    assert TestDisabled.size() == 12
+
+def test_aligned_packet_field_setters():
+    class TestSetters(pak.AlignedPacket):
+        first:  pak.Int8
+        second: pak.Int8
+
+        @property
+        def second(self):
+            return self._second
+
+        @second.setter
+        def second(self, value):
+            self._second = value + 1
+
+        def __setattr__(self, attr, value):
+            if attr == "_first_type_value":
+                value += 1
+
+            super().__setattr__(attr, value)
+
+    packet = TestSetters.unpack(b"\x01\x02")
+    assert packet.first  == 2
+    assert packet.second == 3
+
+def test_aligned_packet_unpack_many():
+    assert AlignedTest.unpack_many(
+        b"\x01\x00\xAA\xAA\x02\x00\x00\x00\x03\xBB\xBB\xBB" +
+        b"\x04\x00\xAA\xAA\x05\x00\x00\x00\x06\xBB\xBB\xBB",
+
+        2,
+    ) == [AlignedTest(first=1, second=2, third=3), AlignedTest(first=4, second=5, third=6)]
+
+    assert AlignedStructTest.unpack_many(
+        b"\x01\x00\xAA\xAA\x00\x00\x00\x40\x01\xBB\xBB\xBB" +
+        b"\x02\x00\xAA\xAA\x00\x00\x80\x40\x00\xBB\xBB\xBB",
+
+        2,
+    ) == [AlignedStructTest(first=1, second=2.0, third=True), AlignedStructTest(first=2, second=4.0, third=False)]
+
+    assert AlignedStructTest.unpack_many(b"", 0) == []
+
+    with pytest.raises(pak.util.BufferOutOfDataError, match="padding"):
+        AlignedStructTest.unpack_many(b"\x01\x00\xAA\xAA\x00\x00\x00\x40\x01\xBB\xBB\xBB\x02\x00", 2)
+
+def test_aligned_packet_unpack_many_overridden():
+    class TestOverridden(AlignedStructTest):
+        @classmethod
+        def unpack(cls, buf, *, ctx=None):
+            packet = super().unpack(buf, ctx=ctx)
+            packet.first += 1
+
+            return packet
+
+    assert TestOverridden.unpack_many(b"\x01\x00\xAA\xAA\x00\x00\x00\x40\x01\xBB\xBB\xBB", 1) == [
+        TestOverridden(first=2, second=2.0, third=True),
+    ]
+
+def test_aligned_packet_dynamic_size():
+    class TestDynamicSize(pak.AlignedPacket):
+        first:  pak.Int8
+        second: pak.Int16[2]
+
+    assert TestDynamicSize._constant_size is None
+
+    assert TestDynamicSize(first=1, second=[2, 3]).size() == 6
+    assert TestDynamicSize(first=1, second=[2, 3]).pack() == b"\x01\x00\x02\x00\x03\x00"
+
+def test_aligned_packet_struct_raw_data():
+    data = b"\x01\x00\xAA\xAA\x00\x00\x00\x40\x01\xBB\xBB\xBB"
+    packet = AlignedStructTest(first=1, second=2.0, third=True)
+
+    assert AlignedStructTest.unpack(data)                         == packet
+    assert AlignedStructTest.unpack(bytearray(data))              == packet
+    assert AlignedStructTest.unpack(memoryview(data))             == packet
+    assert AlignedStructTest.unpack(data + b"trailing data")      == packet
+    assert AlignedStructTest.unpack(pak.util.file_object(data))   == packet
+
+def test_aligned_packet_struct_pack_fallback():
+    class TestPackFallback(pak.AlignedPacket):
+        first:  pak.Int8
+        second: pak.Int16
+
+    # Values which the individual types accept are still
+    # accepted even when all the fields are packed at once.
+    assert TestPackFallback(first=[1], second=2).pack() == b"\x01\x00\x02\x00"
+
+    with pytest.raises(struct.error):
+        TestPackFallback(first="a").pack()
@@ -1,3 +1,4 @@
+import struct
 import sys
 import types
 
@@ -94,6 +95,9 @@ def test_packet_context():
     # Test that a context isn't needed when fields are supplied.
     assert MyPacket(field=1).field == 1
 
+    # The default constructed context is reused.
+    assert pak.Packet._default_ctx() is pak.Packet._default_ctx()
+
 def test_reserved_field():
     with pytest.raises(pak.ReservedFieldError, match="ctx"):
         class TestReservedField(pak.Packet):
@@ -217,6 +221,120 @@ async def test_packet_property():
     with pytest.raises(AttributeError):
         TestReadOnly(read_only=2)
 
+def test_packet_unpack_memoryview():
+    class TestMemoryview(pak.Packet):
+        first:  pak.Int8
+        second: pak.Int16
+
+    assert TestMemoryview.unpack(memoryview(b"\x01\x02\x00")) == TestMemoryview(first=1, second=2)
+
+async def test_packet_struct_runs():
+    class TestRuns(pak.Packet):
+        first:  pak.Int8
+        length: pak.UInt16
+        array:  pak.Int8["length"]
+        big:    pak.Int16.big_endian()
+        little: pak.Int16
+        last:   pak.Float32
+
+    await pak.test.packet_behavior_both(
+        (
+            TestRuns(first=1, length=2, array=[3, 4], big=5, little=6, last=7.0),
+
+            b"\x01\x02\x00\x03\x04\x00\x05\x06\x00\x00\x00\xE0\x40",
+        ),
+    )
+
+    with pytest.raises(struct.error):
+        TestRuns.unpack(b"\x01")
+
+    # Values which the individual types accept are still
+    # accepted even when they're packed as part of a run.
+    assert TestRuns(first=[1], length=0, big=[5], little=6).pack() == b"\x01\x00\x00\x00\x05\x06\x00\x00\x00\x00\x00"
+
+    with pytest.raises(struct.error):
+        TestRuns(first="a").pack()
+
+def test_packet_custom_setattr():
+    class TestSetattr(pak.Packet):
+        field: pak.Int8
+
+        def __setattr__(self, attr, value):
+            if attr == "_field_type_value":
+                value += 1
+
+            super().__setattr__(attr, value)
+
+    assert TestSetattr().field              == 1
+    assert TestSetattr(field=1).field       == 2
+    assert TestSetattr.unpack(b"\x01").field == 2
+
+def test_packet_read_only_unpack():
+    class TestReadOnly(pak.Packet):
+        read_only: pak.Int8
+        after:     pak.Int16.big_endian()
+
+        @property
+        def read_only(self):
+            return 1
+
+    assert TestReadOnly.unpack(b"\x01\x00\x02").after == 2
+
+    class TestReadOnlyVarint(pak.Packet):
+        read_only: pak.ULEB128
+        after:     pak.Int8
+
+        @property
+        def read_only(self):
+            return 1
+
+    assert TestReadOnlyVarint.unpack(b"\x81\x01\x02").after == 2
+
+def test_packet_type_attribute_error():
+    class TestType(pak.Type):
+        @classmethod
+        def _default(cls, *, ctx):
+            return ctx.missing_attr
+
+        @classmethod
+        def _unpack(cls, buf, *, ctx):
+            return ctx.missing_attr
+
+    class TestAttributeError(pak.Packet):
+        field: TestType
+
+        def __setattr__(self, attr, value):
+            super().__setattr__(attr, value)
+
+    with pytest.raises(AttributeError, match="missing_attr"):
+        TestAttributeError()
+
+    with pytest.raises(AttributeError, match="missing_attr"):
+        TestAttributeError.unpack(b"")
+
+def test_packet_generated_functions():
+    class TestGenerated(pak.Packet):
+        field: pak.Int8
+
+    for function in (
+        TestGenerated._initialize_fields,
+        TestGenerated._fields_equal,
+        TestGenerated._fields_repr,
+        TestGenerated._fields_size,
+        TestGenerated._unpack_fields,
+        TestGenerated._pack_fields,
+    ):
+        assert function.__module__ == __name__
+        assert function.__qualname__.startswith(TestGenerated.__qualname__)
+
+    class TestGeneratedHeader(pak.Packet.Header):
+        field: pak.Int8
+
+    assert TestGeneratedHeader._fields_from_packet.__module__ == __name__
+    assert TestGeneratedHeader._fields_from_packet.__qualname__.startswith(TestGeneratedHeader.__qualname__)
+
+    assert TestGeneratedHeader(TestGenerated(field=1)) == TestGeneratedHeader(field=1)
+
 async def test_packet_inheritance():
     class TestParent(pak.Packet):
         test: pak.Int8
@@ -297,6 +415,42 @@ async def test_packet_multiple_inheritance():
         class TestDuplicateFieldFromParents(DuplicateFirstParent, DuplicateSecondParent):
             pass
 
+def test_packet_deep_inheritance():
+    class Grandparent(pak.Packet):
+        grandparent: pak.Int8
+
+    class Parent(Grandparent):
+        parent: pak.Int8
+
+    class Child(Parent):
+        child: pak.Int8
+
+    assert list(Child.field_names()) == ["grandparent", "parent", "child"]
+
+    class OtherParent(Grandparent):
+        other: pak.Int8
+
+    # Fields inherited through multiple bases are only collected once.
+    class DiamondChild(Parent, OtherParent):
+        child: pak.Int8
+
+    assert list(DiamondChild.field_names()) == ["grandparent", "parent", "other", "child"]
+
+    with pytest.raises(pak.DuplicateFieldError, match="grandparent"):
+        class TestDuplicateGrandparentField(Child):
+            grandparent: pak.Int8
+
+    class ReservedParent(Grandparent):
+        RESERVED_FIELDS = ["reserved"]
+
+    with pytest.raises(pak.ReservedFieldError, match="reserved"):
+        class TestReservedGrandparentField(ReservedParent):
+            reserved: pak.Int8
+
+    with pytest.raises(pak.ReservedFieldError, match="ctx"):
+        class TestReservedDefaultField(ReservedParent):
+            ctx: pak.Int8
+
 def test_packet_equality():
     class FooPacket(pak.Packet):
         foo: pak.Int8
@@ -328,6 +482,16 @@ def test_packet_equality():
     assert FooBarPacket(foo=0, bar=0) == UnrelatedFooBarPacket(foo=0, bar=0)
     assert FooBarPacket(foo=0, bar=0) != UnrelatedFooBarPacket(foo=0, bar=1)
 
+    class FloatPacket(pak.Packet):
+        value: pak.Float32
+
+    # Field values are compared with '==', so NaN is still unequal to itself.
+    nan_packet = FloatPacket(value=float("nan"))
+    assert nan_packet != nan_packet
+
+    assert pak.Packet() == pak.Packet()
+    assert repr(pak.Packet()) == "Packet()"
+
 def test_packet_copy_from_immutable():
     orig = pak.Packet()
     orig.make_immutable()
@@ -337,6 +501,66 @@ def test_packet_copy_from_immutable():
     # We can mutate the copy even though the original was immutable.
     copy.foo = 1
 
+def test_packet_copy_deep():
+    class TestCopy(pak.Packet):
+        first:  pak.Int8[2]
+        second: pak.Int8[2]
+
+    orig = TestCopy()
+    orig.second = orig.first
+    orig.self   = orig
+
+    copy = orig.copy()
+    assert copy == orig
+
+    assert copy.first  is not orig.first
+    assert copy.second is copy.first
+    assert copy.self   is copy
+
+def test_packet_copy_custom_deepcopy():
+    class TestCustomDeepcopy(pak.Packet):
+        field: pak.Int8[2]
+
+        def __deepcopy__(self, memo):
+            return TestCustomDeepcopy(field=[3, 4])
+
+    class TestCustomReduce(pak.Packet):
+        field: pak.Int8
+
+        def __reduce__(self):
+            return (TestCustomReduce, ())
+
+    orig = TestCustomDeepcopy()
+    orig.make_immutable()
+
+    copy = orig.copy()
+    assert copy.field == [3, 4]
+
+    copy.field = [5, 6]
+
+    assert TestCustomReduce(field=1).copy() == TestCustomReduce(field=0)
+
+def test_packet_copy_slots():
+    class TestSlots(pak.Packet):
+        __slots__ = ("extra",)
+
+        field: pak.Int8
+
+    orig = TestSlots(field=1)
+    orig.extra = [2]
+    orig.make_immutable()
+
+    copy = orig.copy()
+    assert copy.field == 1
+    assert copy.extra == [2]
+
+    assert copy.extra is not orig.extra
+
+    # The copy is still mutable.
+    copy.field = 3
+
+    assert not hasattr(TestSlots().copy(), "extra")
+
 async def test_header():
     class Test(pak.Packet):
         class Header(pak.Packet.Header):
@@ -386,6 +610,37 @@ def test_header_correct_context():
 
     assert Test().header().check_ctx
 
+def test_header_static():
+    class TestStatic(pak.Packet):
+        id = 1
+
+        class Header(pak.Packet.Header):
+            id: pak.UInt8
+
+    class TestDynamicID(TestStatic):
+        @classmethod
+        def id(cls, *, ctx):
+            return 2
+
+    class TestCustomHeader(TestStatic):
+        def header(self, *, ctx=None):
+            return self.Header(id=3)
+
+    class TestEmpty(pak.Packet):
+        field: pak.Int8
+
+    assert TestStatic._has_static_header
+    assert TestStatic().pack() == b"\x01"
+
+    assert not TestDynamicID._has_static_header
+    assert TestDynamicID().pack() == b"\x02"
+
+    assert not TestCustomHeader._has_static_header
+    assert TestCustomHeader().pack() == b"\x03"
+
+    assert TestEmpty._has_static_header
+    assert TestEmpty(field=1).pack() == b"\x01"
+
 def test_header_positional_only():
     class TestHeader(pak.Packet.Header):
         packet: pak.UInt8
@@ -543,6 +798,21 @@ def test_packet_size():
 
     assert DynamicPacket().size() == 1
 
+    class MixedPacket(pak.Packet):
+        first:  pak.UInt8
+        array:  pak.UInt8[pak.UInt8]
+        second: pak.Int32
+        raw:    pak.RawByte[None]
+
+    assert MixedPacket().size() == 6
+    assert MixedPacket(array=[1, 2, 3], raw=b"raw").size() == 1 + 4 + 4 + 3
+
+    class TestEmpty(pak.Packet):
+        pass
+
+    assert TestEmpty.size()   == 0
+    assert TestEmpty().size() == 0
+
 def test_subclass_id():
     class Root(pak.Packet):
         pass
@@ -570,6 +840,27 @@ def test_generic_with_id():
 
     assert list(TestPacket.GenericWithID(1).field_names()) == ["field", "data"]
 
+    assert TestPacket.GenericWithID(1) is TestPacket.GenericWithID(1)
+
+    # Equal IDs of different types get different classes.
+    assert TestPacket.GenericWithID(True) is not TestPacket.GenericWithID(1)
+    assert TestPacket.GenericWithID(True).id() is True
+
+    class TestChild(TestPacket):
+        pass
+
+    # Subclasses get their own classes.
+    assert TestChild.GenericWithID(1) is not TestPacket.GenericWithID(1)
+    assert issubclass(TestChild.GenericWithID(1), TestChild)
+
+def test_empty_with_id():
+    class TestPacket(pak.Packet):
+        class Header(pak.Packet.Header):
+            id: pak.UInt8
+
+    assert TestPacket.EmptyWithID(1) is TestPacket.EmptyWithID(1)
+    assert TestPacket.EmptyWithID(True) is not TestPacket.EmptyWithID(1)
+
 test_generic = pak.test.packet_behavior_func_both(
     (pak.GenericPacket(data=b"\xAA\xBB\xCC"), b"\xAA\xBB\xCC"),
 )
@@ -0,0 +1,5 @@
+import importlib.metadata
+import pak
+
+def test_version():
+    assert pak.__version__ == importlib.metadata.version("pak")
@@ -1,3 +1,4 @@
+import copy
 import inspect
 import pak
 import pytest
@@ -57,6 +58,8 @@ def test_type_context():
     with pytest.raises(TypeError, match="immutable"):
         type_ctx.packet = None
 
+    assert copy.copy(type_ctx) == type_ctx
+
 def test_typelike():
     assert pak.Type.is_typelike(pak.Int8)
     assert pak.Type(pak.Int8) is pak.Int8
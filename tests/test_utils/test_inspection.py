@@ -20,6 +20,14 @@ def test_subclasses():
     assert subclasses == {Child1, Child2, GrandChild1}
     assert isinstance(subclasses, frozenset)
 
+    class DiamondChild(Child1, Child2):
+        pass
+
+    class DiamondGrandChild(DiamondChild):
+        pass
+
+    assert pak.util.subclasses(Root) == {Child1, Child2, GrandChild1, DiamondChild, DiamondGrandChild}
+
 def test_annotations():
     def test_empty_callable(x):
         pass